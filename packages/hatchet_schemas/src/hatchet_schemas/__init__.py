@@ -1,6 +1,7 @@
 from hatchet_schemas.schemas import (
     ChatOtelInput,
     ChatOtelOutput,
+    CpuHeavyTaskInput,
     ExternallyTriggeredTaskInput,
     ExternallyTriggeredTaskOutput,
     SayHelloInput,
@@ -10,9 +11,9 @@ from hatchet_schemas.schemas import (
 __all__ = [
     "ChatOtelInput",
     "ChatOtelOutput",
+    "CpuHeavyTaskInput",
     "ExternallyTriggeredTaskInput",
     "ExternallyTriggeredTaskOutput",
     "SayHelloInput",
     "SayHelloOutput",
 ]
-
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 
 class ExternallyTriggeredTaskInput(BaseModel):
@@ -30,3 +30,22 @@ class ChatOtelInput(BaseModel):
 
 class ChatOtelOutput(BaseModel):
     answer: str | None
+
+
+CPU_HEAVY_MAX_CHUNKS = 10_000
+
+
+class CpuHeavyTaskInput(BaseModel):
+    iterations: int = Field(default=8_000_000, ge=1, le=200_000_000)
+    chunk_size: int = Field(default=500_000, ge=1, le=200_000_000)
+    parallelism: int | None = Field(default=None, ge=1, le=256)
+
+    @model_validator(mode="after")
+    def _limit_chunks(self) -> "CpuHeavyTaskInput":
+        chunks = -(-self.iterations // self.chunk_size)
+        if chunks > CPU_HEAVY_MAX_CHUNKS:
+            raise ValueError(
+                f"iterations / chunk_size gives {chunks} chunks; "
+                f"at most {CPU_HEAVY_MAX_CHUNKS} are allowed"
+            )
+        return self
@@ -0,0 +1,98 @@
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheOutcome(StrEnum):
+    HIT = "hit"
+    MISS = "miss"
+    IN_FLIGHT = "in_flight"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    in_flight_joins: int = 0
+    evictions: int = 0
+
+
+class AsyncTTLCache(Generic[K, V]):
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 300.0) -> None:
+        """Size-bounded LRU cache with a TTL and in-flight deduplication.
+
+        Concurrent lookups of a missing key share one computation instead of each
+        starting their own. Failed computations are not cached.
+
+        Args:
+            maxsize: Maximum cached entries before least-recently-used eviction.
+            ttl_seconds: How long an entry stays valid after it is stored.
+
+        Raises:
+            ValueError: If ``maxsize`` or ``ttl_seconds`` is not positive.
+        """
+        if maxsize <= 0 or ttl_seconds <= 0:
+            raise ValueError("maxsize and ttl_seconds must be > 0")
+
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._in_flight: dict[K, asyncio.Task[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: K) -> tuple[bool, V | None]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: K, value: V) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get_or_compute(
+        self, key: K, compute: Callable[[], Awaitable[V]]
+    ) -> tuple[V, CacheOutcome]:
+        """Return the cached value for ``key``, computing it at most once at a time."""
+        found, value = self._lookup(key)
+        if found:
+            self.stats.hits += 1
+            return value, CacheOutcome.HIT  # type: ignore[return-value]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.stats.in_flight_joins += 1
+            return await asyncio.shield(task), CacheOutcome.IN_FLIGHT
+
+        self.stats.misses += 1
+        task = asyncio.ensure_future(compute())
+        self._in_flight[key] = task
+
+        def settle(done: asyncio.Task[V]) -> None:
+            self._in_flight.pop(key, None)
+            if not done.cancelled() and done.exception() is None:
+                self._store(key, done.result())
+
+        task.add_done_callback(settle)
+        # Shield so a cancelled caller does not cancel joiners' shared computation.
+        return await asyncio.shield(task), CacheOutcome.MISS
@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from hatchet_playground.cpu_engine import (
+    DEFAULT_MAX_WORKERS,
+    hash_chunk,
+    map_reduce_hash,
+    warm_process_pool,
+)
+
+
+def run_serial(iterations: int) -> dict[str, int | float | str]:
+    started = time.perf_counter()
+    chunk = hash_chunk(0, iterations)
+    return {
+        "digest": f"{chunk.digest:016x}",
+        "execution_time": time.perf_counter() - started,
+    }
+
+
+async def run_chunked(
+    iterations: int, chunk_size: int, workers: int
+) -> dict[str, int | float | str]:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        warm_process_pool(pool, workers)
+        return await map_reduce_hash(
+            pool, iterations=iterations, chunk_size=chunk_size, parallelism=workers
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare serial and chunked process-pool hashing wall time."
+    )
+    parser.add_argument("--iterations", type=int, default=2_000_000)
+    parser.add_argument("--chunk-size", type=int, default=250_000)
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    serial = run_serial(args.iterations)
+    chunked = asyncio.run(run_chunked(args.iterations, args.chunk_size, args.workers))
+
+    if serial["digest"] != chunked["digest"]:
+        raise SystemExit("Chunked digest does not match serial digest")
+
+    report = {
+        "iterations": args.iterations,
+        "chunk_size": args.chunk_size,
+        "workers": args.workers,
+        "serial_seconds": serial["execution_time"],
+        "chunked_seconds": chunked["execution_time"],
+        "speedup": serial["execution_time"] / chunked["execution_time"],
+    }
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
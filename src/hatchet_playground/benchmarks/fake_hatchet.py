@@ -0,0 +1,276 @@
+import asyncio
+import itertools
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+
+from hatchet_sdk import EmptyModel, TriggerWorkflowOptions
+from hatchet_sdk.clients.rest.models.v1_task_status import V1TaskStatus
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from hatchet_playground.external.status_watcher import TERMINAL_STATUSES
+
+# Raw outputs of the registered tasks, computed from their JSON input.
+FAKE_OUTPUTS: dict[str, Callable[[Any], dict[str, Any]]] = {
+    "externally-triggered-task": lambda input: {"ok": True},
+    "first-workflow": lambda input: {"meaning_of_life": 42},
+    "say_hello": lambda input: {"message": f"Hello, {input['name']}!"},
+}
+
+
+class FakeEventType(str, Enum):
+    STARTED = "STEP_RUN_EVENT_TYPE_STARTED"
+    COMPLETED = "STEP_RUN_EVENT_TYPE_COMPLETED"
+
+
+@dataclass(frozen=True)
+class FakeEvent:
+    type: FakeEventType
+    payload: str
+
+
+@dataclass(frozen=True)
+class FakeMeta:
+    id: str
+
+
+@dataclass
+class FakeRun:
+    workflow_run_external_id: str
+    task_name: str
+    input: Any
+    created_at: datetime
+    additional_metadata: dict[str, str] = field(default_factory=dict)
+    output: dict[str, Any] = field(default_factory=dict)
+    status: V1TaskStatus = V1TaskStatus.QUEUED
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def metadata(self) -> FakeMeta:
+        return FakeMeta(id=self.workflow_run_external_id)
+
+
+@dataclass(frozen=True)
+class FakeRunList:
+    rows: list[FakeRun]
+
+
+@dataclass(frozen=True)
+class FakeBulkItem:
+    input: Any
+    # NOTE: Neither this field nor ``options.key`` is sent by the SDK; both are ignored.
+    key: str | None
+    options: TriggerWorkflowOptions
+
+
+class FakeRunRef:
+    def __init__(
+        self,
+        backend: "FakeHatchet",
+        workflow_run_id: str,
+        output_validator: TypeAdapter[Any] | None = None,
+    ) -> None:
+        self._backend = backend
+        self.workflow_run_id = workflow_run_id
+        self._output_validator = output_validator
+
+    async def aio_result(self) -> Any:
+        """Wait for the run and return its output.
+
+        Refs returned by a task stub validate the output into the stub's output
+        type; refs from ``runs.get_run_ref`` return the raw outputs by task name.
+        """
+        run = self._backend.runs.get_run(self.workflow_run_id)
+        await run.done.wait()
+        if self._output_validator is None:
+            return {run.task_name: run.output}
+        return self._output_validator.validate_python(run.output)
+
+    async def stream(self) -> AsyncIterator[FakeEvent]:
+        run = self._backend.runs.get_run(self.workflow_run_id)
+        await run.done.wait()
+        yield FakeEvent(type=FakeEventType.STARTED, payload="")
+        yield FakeEvent(type=FakeEventType.COMPLETED, payload="")
+
+
+class FakeRunsClient:
+    def __init__(self, backend: "FakeHatchet") -> None:
+        self._backend = backend
+        self._runs: dict[str, FakeRun] = {}
+        self._terminal: list[FakeRun] = []
+        self.api_calls: dict[str, int] = {}
+
+    def count_call(self, method: str) -> None:
+        self.api_calls[method] = self.api_calls.get(method, 0) + 1
+
+    def get_run(self, workflow_run_id: str) -> FakeRun:
+        try:
+            return self._runs[workflow_run_id]
+        except KeyError:
+            raise KeyError(f"Unknown workflow_run_id={workflow_run_id}") from None
+
+    def add(self, run: FakeRun) -> None:
+        self._runs[run.workflow_run_external_id] = run
+
+    def mark_terminal(self, run: FakeRun) -> None:
+        self._terminal.append(run)
+
+    def get_run_ref(self, workflow_run_id: str) -> FakeRunRef:
+        return FakeRunRef(self._backend, workflow_run_id)
+
+    async def aio_get_status(self, workflow_run_id: str) -> V1TaskStatus:
+        self.count_call("aio_get_status")
+        await asyncio.sleep(self._backend.api_latency_seconds)
+        return self.get_run(workflow_run_id).status
+
+    async def aio_list(
+        self,
+        since: datetime | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        statuses: list[V1TaskStatus] | None = None,
+        **filters: Any,
+    ) -> FakeRunList:
+        """List runs newest first, like the Hatchet REST endpoint.
+
+        Of the remaining filters only ``additional_metadata`` is applied.
+        """
+        metadata = (filters.get("additional_metadata") or {}).items()
+        self.count_call("aio_list")
+        await asyncio.sleep(self._backend.api_latency_seconds)
+
+        # Terminal-only queries are served from the completion log.
+        source = (
+            self._terminal
+            if statuses and set(statuses) <= TERMINAL_STATUSES
+            else list(self._runs.values())
+        )
+        rows = [
+            run
+            for run in reversed(source)
+            if (since is None or run.created_at >= since)
+            and (not statuses or run.status in statuses)
+            and metadata <= run.additional_metadata.items()
+        ]
+        start = offset or 0
+        stop = None if limit is None else start + limit
+        return FakeRunList(rows=rows[start:stop])
+
+
+class FakeTaskStub:
+    def __init__(
+        self,
+        backend: "FakeHatchet",
+        name: str,
+        output_validator: type[Any] | None = None,
+    ) -> None:
+        self._backend = backend
+        self.name = name
+        self._output_validator = TypeAdapter(output_validator or EmptyModel)
+
+    def create_bulk_run_item(
+        self,
+        input: Any = None,
+        key: str | None = None,
+        options: TriggerWorkflowOptions | None = None,
+    ) -> Any:
+        return FakeBulkItem(
+            input=input, key=key, options=options or TriggerWorkflowOptions()
+        )
+
+    async def aio_run_no_wait(
+        self, input: Any = None, options: TriggerWorkflowOptions | None = None
+    ) -> FakeRunRef:
+        (run_ref,) = await self.aio_run_many_no_wait(
+            [self.create_bulk_run_item(input, options=options)]
+        )
+        return run_ref
+
+    async def aio_run_many_no_wait(self, workflows: list[Any]) -> list[FakeRunRef]:
+        self._backend.runs.count_call("aio_run_many_no_wait")
+        await asyncio.sleep(self._backend.api_latency_seconds)
+        return [
+            FakeRunRef(self._backend, workflow_run_id, self._output_validator)
+            for workflow_run_id in self._backend.enqueue_many(self.name, workflows)
+        ]
+
+
+class FakeStubs:
+    def __init__(self, backend: "FakeHatchet") -> None:
+        self._backend = backend
+
+    def task(
+        self, name: str, output_validator: type[Any] | None = None, **_: Any
+    ) -> FakeTaskStub:
+        return FakeTaskStub(self._backend, name, output_validator)
+
+
+class FakeHatchet:
+    def __init__(
+        self,
+        slots: int = 100,
+        api_latency_seconds: float = 0.002,
+        run_duration_seconds: float = 0.05,
+        outputs: Mapping[str, Callable[[Any], dict[str, Any]]] = FAKE_OUTPUTS,
+    ) -> None:
+        """In-process stand-in for the Hatchet client used by the external runner.
+
+        It implements just the surface used by ``ExternalTaskRunner``, the status
+        watcher, the event broadcaster and the trigger API: task stubs, bulk
+        triggers and the runs client. Runs execute on a simulated worker with
+        ``slots`` concurrent slots, and every API call costs
+        ``api_latency_seconds``. Like hatchet-sdk 1.24, it ignores run keys, so
+        every trigger creates new runs.
+
+        Args:
+            slots: Concurrent runs the simulated worker executes.
+            api_latency_seconds: Simulated round-trip time of each API call.
+            run_duration_seconds: Simulated execution time of each run.
+            outputs: Raw output of each task name, computed from the run input.
+                Other tasks complete with an empty output.
+        """
+        self.api_latency_seconds = api_latency_seconds
+        self.run_duration_seconds = run_duration_seconds
+        self.outputs = outputs
+        self.runs = FakeRunsClient(self)
+        self.stubs = FakeStubs(self)
+        self._slots = asyncio.Semaphore(slots)
+        self._ids = itertools.count()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def enqueue_many(self, task_name: str, items: list[FakeBulkItem]) -> list[str]:
+        """Create runs for ``items`` and return their IDs."""
+        return [self._enqueue(task_name, item) for item in items]
+
+    def _enqueue(self, task_name: str, item: FakeBulkItem) -> str:
+        workflow_run_id = f"fake-{next(self._ids):012d}"
+        run = FakeRun(
+            workflow_run_external_id=workflow_run_id,
+            task_name=task_name,
+            input=to_jsonable_python(item.input),
+            created_at=datetime.now(tz=UTC),
+            additional_metadata=dict(item.options.additional_metadata),
+        )
+        self.runs.add(run)
+
+        task = asyncio.get_running_loop().create_task(self._execute(run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return workflow_run_id
+
+    async def _execute(self, run: FakeRun) -> None:
+        async with self._slots:
+            run.status = V1TaskStatus.RUNNING
+            run.started_at = datetime.now(tz=UTC)
+            await asyncio.sleep(self.run_duration_seconds)
+            output = self.outputs.get(run.task_name)
+            run.output = {} if output is None else output(run.input)
+            run.status = V1TaskStatus.COMPLETED
+            run.finished_at = datetime.now(tz=UTC)
+        self.runs.mark_terminal(run)
+        run.done.set()
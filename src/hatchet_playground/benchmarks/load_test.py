@@ -0,0 +1,367 @@
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import sys
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, fields
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Literal
+
+import httpx
+from hatchet_sdk import Hatchet
+
+from hatchet_playground.benchmarks.fake_hatchet import FakeHatchet
+from hatchet_playground.external.api import create_app
+from hatchet_playground.external.runner import ExternalTaskRunner, parse_input_json
+from hatchet_playground.external.status_watcher import (
+    RunStatusWatcher,
+    WatchedRun,
+    WatcherSettings,
+)
+
+TriggerFn = Callable[[list[dict[str, Any]], list[str] | None], Awaitable[list[str]]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    task_name: str
+    runs: int
+    concurrency: int
+    bulk_size: int
+    arrival: Literal["open", "closed"] = "closed"
+    rate: float = 100.0
+    input_payload: dict[str, Any] | None = None
+    key_prefix: str | None = None
+    timeout_seconds: float = 300.0
+
+
+@dataclass
+class RunRecord:
+    run_index: int
+    bulk_index: int
+    workflow_run_id: str
+    status: str
+    trigger_latency: float
+    queue_to_start: float | None
+    execution_time: float | None
+    end_to_end: float
+    api_calls: float
+    created_at: datetime | None
+    started_at: datetime | None
+    finished_at: datetime | None
+
+
+def _seconds_between(start: datetime | None, end: datetime | None) -> float | None:
+    if start is None or end is None:
+        return None
+    return (end - start).total_seconds()
+
+
+def _record(
+    run_index: int,
+    bulk_index: int,
+    trigger_latency: float,
+    end_to_end: float,
+    watched: WatchedRun,
+) -> RunRecord:
+    # NOTE: Server timestamps are only compared with each other; end_to_end is
+    # measured on the local clock, so clock skew never leaks into the latencies.
+    return RunRecord(
+        run_index=run_index,
+        bulk_index=bulk_index,
+        workflow_run_id=watched.workflow_run_id,
+        status=watched.status.value,
+        trigger_latency=trigger_latency,
+        queue_to_start=_seconds_between(watched.created_at, watched.started_at),
+        execution_time=_seconds_between(watched.started_at, watched.finished_at),
+        end_to_end=end_to_end,
+        api_calls=watched.api_calls,
+        created_at=watched.created_at,
+        started_at=watched.started_at,
+        finished_at=watched.finished_at,
+    )
+
+
+async def _run_bulk(
+    scenario: Scenario,
+    trigger: TriggerFn,
+    watcher: RunStatusWatcher,
+    bulk_index: int,
+    run_indexes: range,
+) -> list[RunRecord]:
+    payloads = [dict(scenario.input_payload or {}) for _ in run_indexes]
+    keys = None
+    if scenario.key_prefix is not None:
+        keys = [f"{scenario.key_prefix}:{scenario.task_name}:{i}" for i in run_indexes]
+
+    submitted_at = datetime.now(tz=UTC)
+    started = time.perf_counter()
+    workflow_run_ids = await trigger(payloads, keys)
+    trigger_latency = time.perf_counter() - started
+
+    # Narrow the watcher's list window to this bulk call.
+    since = submitted_at - timedelta(seconds=5)
+
+    async def watch(run_index: int, run_id: str) -> RunRecord:
+        watched = await watcher.watch(
+            run_id, timeout_seconds=scenario.timeout_seconds, since=since
+        )
+        end_to_end = time.perf_counter() - started
+        return _record(run_index, bulk_index, trigger_latency, end_to_end, watched)
+
+    return await asyncio.gather(
+        *(
+            watch(run_index, run_id)
+            for run_index, run_id in zip(run_indexes, workflow_run_ids, strict=True)
+        )
+    )
+
+
+async def run_scenario(
+    scenario: Scenario, trigger: TriggerFn, watcher: RunStatusWatcher
+) -> tuple[list[RunRecord], float]:
+    """Trigger ``scenario.runs`` runs in bulks and wait for all of them.
+
+    Closed-loop arrival keeps at most ``concurrency`` bulks in flight end to end.
+    Open-loop arrival releases bulks at ``rate`` runs per second regardless of
+    completions, with at most ``concurrency`` trigger calls in flight.
+
+    Returns:
+        Per-run records and the scenario wall time in seconds.
+    """
+    bulks = [
+        range(start, min(start + scenario.bulk_size, scenario.runs))
+        for start in range(0, scenario.runs, scenario.bulk_size)
+    ]
+    semaphore = asyncio.Semaphore(scenario.concurrency)
+
+    async def closed_loop(bulk_index: int, run_indexes: range) -> list[RunRecord]:
+        async with semaphore:
+            return await _run_bulk(scenario, trigger, watcher, bulk_index, run_indexes)
+
+    async def limited_trigger(
+        payloads: list[dict[str, Any]], keys: list[str] | None
+    ) -> list[str]:
+        async with semaphore:
+            return await trigger(payloads, keys)
+
+    async def open_loop(bulk_index: int, run_indexes: range) -> list[RunRecord]:
+        await asyncio.sleep(run_indexes.start / scenario.rate)
+        return await _run_bulk(
+            scenario, limited_trigger, watcher, bulk_index, run_indexes
+        )
+
+    arrive = closed_loop if scenario.arrival == "closed" else open_loop
+    started = time.perf_counter()
+    results = await asyncio.gather(*(arrive(i, r) for i, r in enumerate(bulks)))
+    wall_seconds = time.perf_counter() - started
+    return [record for bulk in results for record in bulk], wall_seconds
+
+
+def percentiles(values: list[float]) -> dict[str, float | None]:
+    if not values:
+        return {"p50": None, "p95": None, "p99": None, "mean": None, "max": None}
+
+    ordered = sorted(values)
+
+    def nearest_rank(q: float) -> float:
+        return ordered[max(0, min(len(ordered) - 1, round(q * len(ordered)) - 1))]
+
+    return {
+        "p50": nearest_rank(0.50),
+        "p95": nearest_rank(0.95),
+        "p99": nearest_rank(0.99),
+        "mean": sum(ordered) / len(ordered),
+        "max": ordered[-1],
+    }
+
+
+def summarize(
+    scenario: Scenario, records: list[RunRecord], wall_seconds: float
+) -> dict[str, Any]:
+    statuses = Counter(record.status for record in records)
+
+    def metric(name: str) -> dict[str, float | None]:
+        return percentiles(
+            [value for r in records if (value := getattr(r, name)) is not None]
+        )
+
+    return {
+        "scenario": asdict(scenario),
+        "wall_seconds": wall_seconds,
+        "throughput_runs_per_second": statuses["COMPLETED"] / wall_seconds,
+        "statuses": dict(statuses),
+        "trigger_latency": metric("trigger_latency"),
+        "queue_to_start": metric("queue_to_start"),
+        "execution_time": metric("execution_time"),
+        "end_to_end": metric("end_to_end"),
+        "api_calls_per_run": metric("api_calls"),
+    }
+
+
+def write_json(path: Path, summary: dict[str, Any]) -> None:
+    path.write_text(json.dumps(summary, indent=2, default=str) + "\n")
+
+
+def write_csv(path: Path, records: list[RunRecord]) -> None:
+    with path.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=[f.name for f in fields(RunRecord)])
+        writer.writeheader()
+        writer.writerows(asdict(record) for record in records)
+
+
+def runner_trigger(runner: ExternalTaskRunner) -> TriggerFn:
+    async def trigger(
+        payloads: list[dict[str, Any]], keys: list[str] | None
+    ) -> list[str]:
+        run_refs = await runner.trigger_many_no_wait(payloads, keys=keys)
+        return [run_ref.workflow_run_id for run_ref in run_refs]
+
+    return trigger
+
+
+def api_trigger(client: httpx.AsyncClient, task_name: str) -> TriggerFn:
+    async def trigger(
+        payloads: list[dict[str, Any]], keys: list[str] | None
+    ) -> list[str]:
+        if len(payloads) == 1 and keys is None:
+            response = await client.post(
+                f"/tasks/{task_name}/run", json={"input_payload": payloads[0]}
+            )
+            response.raise_for_status()
+            return [response.json()["workflow_run_id"]]
+
+        response = await client.post(
+            f"/tasks/{task_name}/run-many",
+            json={"input_payloads": payloads, "keys": keys},
+        )
+        response.raise_for_status()
+        return response.json()["workflow_run_ids"]
+
+    return trigger
+
+
+async def run_benchmark(
+    scenario: Scenario,
+    hatchet: Any,
+    target: Literal["runner", "api"] = "runner",
+    watch_min_interval_seconds: float = 0.2,
+) -> dict[str, Any]:
+    """Run one scenario against a real or fake Hatchet client.
+
+    Returns:
+        The summary dict with ``records`` holding per-run ``RunRecord`` rows.
+    """
+    watcher = RunStatusWatcher(
+        hatchet.runs,
+        WatcherSettings(min_interval_seconds=watch_min_interval_seconds),
+    )
+    try:
+        if target == "runner":
+            runner = ExternalTaskRunner(
+                task_name=scenario.task_name,
+                input_payload={},
+                hatchet=hatchet,
+            )
+            records, wall_seconds = await run_scenario(
+                scenario, runner_trigger(runner), watcher
+            )
+        else:
+            app = create_app(hatchet)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://benchmark"
+            ) as client:
+                records, wall_seconds = await run_scenario(
+                    scenario, api_trigger(client, scenario.task_name), watcher
+                )
+            await app.state.services.aclose()
+    finally:
+        await watcher.aclose()
+
+    summary = summarize(scenario, records, wall_seconds)
+    summary["target"] = target
+    summary["watcher"] = asdict(watcher.stats)
+    if isinstance(hatchet, FakeHatchet):
+        summary["fake_api_calls"] = dict(hatchet.runs.api_calls)
+    summary["records"] = records
+    return summary
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Headless load test for Hatchet tasks via ExternalTaskRunner."
+    )
+    parser.add_argument("--task-name", default="externally-triggered-task")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--bulk-size", type=int, default=50)
+    parser.add_argument("--arrival", choices=["open", "closed"], default="closed")
+    parser.add_argument(
+        "--rate", type=float, default=100.0, help="Open-loop arrival rate (runs/s)"
+    )
+    parser.add_argument("--input-json", default='{"user_id": 1}')
+    parser.add_argument(
+        "--key-prefix",
+        default=None,
+        help="Tag runs with the keys '<prefix>:<task>:<index>'",
+    )
+    parser.add_argument("--timeout-seconds", type=float, default=300.0)
+    parser.add_argument("--target", choices=["runner", "api"], default="runner")
+    parser.add_argument("--watch-min-interval", type=float, default=0.2)
+    parser.add_argument(
+        "--fake", action="store_true", help="Use the in-process fake Hatchet backend"
+    )
+    parser.add_argument("--fake-slots", type=int, default=100)
+    parser.add_argument("--fake-api-latency-ms", type=float, default=2.0)
+    parser.add_argument("--fake-run-duration-ms", type=float, default=50.0)
+    parser.add_argument("--output-json", type=Path, default=None)
+    parser.add_argument("--output-csv", type=Path, default=None)
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    scenario = Scenario(
+        task_name=args.task_name,
+        runs=args.runs,
+        concurrency=args.concurrency,
+        bulk_size=args.bulk_size,
+        arrival=args.arrival,
+        rate=args.rate,
+        input_payload=parse_input_json(args.input_json),
+        key_prefix=args.key_prefix,
+        timeout_seconds=args.timeout_seconds,
+    )
+    hatchet = (
+        FakeHatchet(
+            slots=args.fake_slots,
+            api_latency_seconds=args.fake_api_latency_ms / 1000,
+            run_duration_seconds=args.fake_run_duration_ms / 1000,
+        )
+        if args.fake
+        else Hatchet()
+    )
+    return await run_benchmark(
+        scenario,
+        hatchet,
+        target=args.target,
+        watch_min_interval_seconds=args.watch_min_interval,
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    args = parse_args()
+    summary = asyncio.run(main(args))
+    records = summary.pop("records")
+
+    if args.output_json is not None:
+        write_json(args.output_json, summary)
+    if args.output_csv is not None:
+        write_csv(args.output_csv, records)
+    sys.stdout.write(json.dumps(summary, indent=2, default=str) + "\n")
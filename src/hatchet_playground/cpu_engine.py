@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+import math
+import os
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+
+DEFAULT_MAX_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+
+@dataclass(frozen=True)
+class ChunkResult:
+    start: int
+    stop: int
+    digest: int
+    cpu_seconds: float
+
+
+def hash_chunk(start: int, stop: int) -> ChunkResult:
+    """Hash ``data{i}`` for ``i`` in ``[start, stop)`` and XOR-fold the digests.
+
+    XOR is order independent, so chunk results can be combined in any order and
+    still match a serial run over the full range.
+    """
+    started = time.process_time()
+    digest = 0
+    for i in range(start, stop):
+        digest ^= int.from_bytes(hashlib.sha256(f"data{i}".encode()).digest()[:8])
+    return ChunkResult(
+        start=start,
+        stop=stop,
+        digest=digest,
+        cpu_seconds=time.process_time() - started,
+    )
+
+
+def split_range(iterations: int, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Lazily yield ``[start, stop)`` chunk bounds covering ``range(iterations)``."""
+    if iterations < 0 or chunk_size <= 0:
+        raise ValueError("iterations must be >= 0 and chunk_size must be > 0")
+    for start in range(0, iterations, chunk_size):
+        yield start, min(start + chunk_size, iterations)
+
+
+async def map_reduce_hash(
+    executor: Executor,
+    iterations: int,
+    chunk_size: int,
+    parallelism: int,
+    on_progress: Callable[[int, int], None] | None = None,
+) -> dict[str, int | float | str]:
+    """Map ``hash_chunk`` over the range on ``executor`` and combine the partials.
+
+    Chunks are fed lazily with at most ``parallelism`` in flight, and partials
+    are folded as they finish, so memory does not grow with the chunk count and
+    one run cannot queue its whole range ahead of other runs.
+
+    Args:
+        executor: Executor the chunks run on, usually a process pool.
+        iterations: Total number of hashes to compute.
+        chunk_size: Hashes per chunk.
+        parallelism: Maximum chunks submitted to the executor at once.
+        on_progress: Optional callback receiving ``(done_chunks, total_chunks)``.
+
+    Returns:
+        The combined digest plus iteration, chunk and timing figures.
+    """
+    if parallelism <= 0:
+        raise ValueError("parallelism must be > 0")
+
+    loop = asyncio.get_running_loop()
+    ranges = split_range(iterations, chunk_size)
+    total_chunks = math.ceil(iterations / chunk_size)
+    in_flight: set[asyncio.Future[ChunkResult]] = set()
+    done_chunks = 0
+    digest = 0
+    cpu_time = 0.0
+
+    started = time.perf_counter()
+    try:
+        while True:
+            for start, stop in ranges:
+                in_flight.add(loop.run_in_executor(executor, hash_chunk, start, stop))
+                if len(in_flight) >= parallelism:
+                    break
+            if not in_flight:
+                break
+
+            finished, in_flight = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in finished:
+                chunk = future.result()
+                digest ^= chunk.digest
+                cpu_time += chunk.cpu_seconds
+                done_chunks += 1
+                if on_progress is not None:
+                    on_progress(done_chunks, total_chunks)
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+    return {
+        "iterations": iterations,
+        "chunks": total_chunks,
+        "parallelism": parallelism,
+        "digest": f"{digest:016x}",
+        "execution_time": time.perf_counter() - started,
+        "cpu_time": cpu_time,
+    }
+
+
+def _noop() -> None:
+    time.sleep(0.05)
+
+
+def warm_process_pool(pool: ProcessPoolExecutor, max_workers: int) -> None:
+    """Spawn every pool worker up front so the first run pays no spawn cost."""
+    for future in [pool.submit(_noop) for _ in range(max_workers)]:
+        future.result()
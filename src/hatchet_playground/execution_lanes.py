@@ -0,0 +1,268 @@
+import asyncio
+import atexit
+import contextlib
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any, TypeVar
+
+from hatchet_sdk import Context
+from opentelemetry.metrics import get_meter
+
+from hatchet_playground.cpu_engine import DEFAULT_MAX_WORKERS, warm_process_pool
+
+TaskT = TypeVar("TaskT")
+
+# NOTE: Blocking-lane waiters re-check cancellation at this interval.
+_BLOCKING_WAIT_POLL_SECONDS = 0.1
+
+logger = logging.getLogger(__name__)
+
+
+class Lane(StrEnum):
+    ASYNC = "async"
+    BLOCKING = "blocking"
+    CPU = "cpu"
+
+
+@dataclass(frozen=True)
+class LaneCapacity:
+    async_slots: int = 100
+    blocking_threads: int = 8
+    cpu_processes: int = DEFAULT_MAX_WORKERS
+
+    @classmethod
+    def from_env(cls) -> "LaneCapacity":
+        return cls(
+            async_slots=int(os.getenv("LANE_ASYNC_SLOTS", "100")),
+            blocking_threads=int(os.getenv("LANE_BLOCKING_THREADS", "8")),
+            cpu_processes=int(
+                os.getenv("LANE_CPU_PROCESSES", str(DEFAULT_MAX_WORKERS))
+            ),
+        )
+
+    def slots(self, lane: Lane) -> int:
+        return {
+            Lane.ASYNC: self.async_slots,
+            Lane.BLOCKING: self.blocking_threads,
+            Lane.CPU: self.cpu_processes,
+        }[lane]
+
+
+class ExecutionLanes:
+    def __init__(self, capacity: LaneCapacity) -> None:
+        """Admit runs per lane and own the process pool behind the CPU lane.
+
+        Hatchet admits runs against one worker-wide slot budget, so a worker gets
+        the sum of its lanes' capacities and each lane then admits its own share:
+
+        - Async tasks run on the worker's event loop, bounded only by slots.
+        - Blocking tasks stay plain ``def`` functions on Hatchet's thread pool,
+          which has one thread per slot and can kill a thread on cancellation or
+          timeout. At most ``blocking_threads`` of them run at once.
+        - CPU tasks submit their work to a process pool created on first use. At
+          most ``cpu_processes`` of them run at once.
+
+        A run that finds its lane full waits on the worker, and that wait counts
+        toward its ``execution_timeout``.
+
+        Args:
+            capacity: Concurrency budget of each lane.
+        """
+        self.capacity = capacity
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._blocking = threading.BoundedSemaphore(capacity.blocking_threads)
+        self._cpu = asyncio.Semaphore(capacity.cpu_processes)
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.capacity.cpu_processes
+            )
+        return self._process_pool
+
+    @contextlib.contextmanager
+    def blocking_slot(self, ctx: Context) -> Iterator[None]:
+        """Hold a blocking-lane permit for the duration of a sync run.
+
+        Raises:
+            RuntimeError: If the run is cancelled while waiting for a permit.
+        """
+        while not self._blocking.acquire(timeout=_BLOCKING_WAIT_POLL_SECONDS):
+            if ctx.exit_flag:
+                raise RuntimeError("Run cancelled while waiting for the blocking lane")
+        try:
+            yield
+        finally:
+            self._blocking.release()
+
+    @contextlib.asynccontextmanager
+    async def cpu_slot(self) -> AsyncIterator[None]:
+        """Hold a CPU-lane permit for the duration of an async run."""
+        async with self._cpu:
+            yield
+
+    def warm_up(self) -> None:
+        """Spawn the process lane up front so the first CPU run pays no spawn cost."""
+        warm_process_pool(self.process_pool, self.capacity.cpu_processes)
+
+    def slots_for(self, lanes: Iterable[Lane]) -> int:
+        """Worker slot count that lets every hosted lane run at full capacity."""
+        return sum(self.capacity.slots(lane) for lane in set(lanes))
+
+    def shutdown(self) -> None:
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+
+
+LANES = ExecutionLanes(LaneCapacity.from_env())
+atexit.register(LANES.shutdown)
+
+TASK_LANES: dict[str, Lane] = {}
+
+
+def lane_task(
+    lane: Lane, task_decorator: Callable[[Callable[..., Any]], TaskT]
+) -> Callable[[Callable[..., Any]], TaskT]:
+    """Declare a task's lane and register it with ``task_decorator``.
+
+    Blocking tasks must be plain ``def`` functions and CPU tasks ``async def``
+    functions; both are wrapped so they only run while holding a lane permit.
+    Trivial sync functions that never block can stay on the async lane.
+
+    Example:
+        ``@lane_task(Lane.BLOCKING, hatchet.task(name="sync-sleep-task"))``
+
+    Raises:
+        TypeError: If ``fn`` does not match its lane.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> TaskT:
+        task = task_decorator(_admitted(lane, fn))
+        TASK_LANES[task.name] = lane
+        return task
+
+    return decorator
+
+
+def _admitted(lane: Lane, fn: Callable[..., Any]) -> Callable[..., Any]:
+    is_async = inspect.iscoroutinefunction(fn)
+    if lane is Lane.ASYNC:
+        return fn
+
+    if lane is Lane.BLOCKING:
+        if is_async:
+            raise TypeError(f"Blocking task {fn.__name__} must be a plain def function")
+
+        # NOTE: functools.wraps keeps the signature and annotations Hatchet inspects.
+        @functools.wraps(fn)
+        def run_blocking(input: Any, ctx: Context, **dependencies: Any) -> Any:
+            with LANES.blocking_slot(ctx):
+                return fn(input, ctx, **dependencies)
+
+        return run_blocking
+
+    if not is_async:
+        raise TypeError(f"CPU task {fn.__name__} must be an async def function")
+
+    @functools.wraps(fn)
+    async def run_cpu(input: Any, ctx: Context, **dependencies: Any) -> Any:
+        async with LANES.cpu_slot():
+            return await fn(input, ctx, **dependencies)
+
+    return run_cpu
+
+
+def worker_slots(workflows: Iterable[Any]) -> int:
+    """Slots for a worker hosting ``workflows``; undeclared tasks count as async."""
+    lanes = {TASK_LANES.get(workflow.name, Lane.ASYNC) for workflow in workflows}
+    return LANES.slots_for(lanes)
+
+
+class LoopLagMonitor:
+    def __init__(
+        self,
+        interval_seconds: float = 0.1,
+        threshold_seconds: float = 0.1,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Measure event-loop lag by timing how late a periodic sleep wakes up.
+
+        Lag above ``threshold_seconds`` is logged and recorded on the
+        ``event_loop.lag`` OpenTelemetry histogram.
+
+        Args:
+            interval_seconds: Probe period.
+            threshold_seconds: Minimum lag reported as a stall.
+            logger: Optional logger instance. Defaults to module logger.
+        """
+        self.interval_seconds = interval_seconds
+        self.threshold_seconds = threshold_seconds
+        self.stalls = 0
+        self.max_lag_seconds = 0.0
+        self._logger = logger or logging.getLogger(__name__)
+        self._histogram = get_meter(__name__).create_histogram(
+            "event_loop.lag",
+            unit="s",
+            description="Event loop stalls above the lag threshold",
+        )
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._probe())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _probe(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval_seconds)
+            lag = time.monotonic() - started - self.interval_seconds
+            self.max_lag_seconds = max(self.max_lag_seconds, lag)
+            if lag >= self.threshold_seconds:
+                self.stalls += 1
+                self._histogram.record(lag)
+                self._logger.warning("Event loop stalled for %.3fs", lag)
+
+
+def lanes_lifespan(workflows: Iterable[Any]) -> Callable[[], AsyncIterator[None]]:
+    """Build a worker lifespan that runs the loop lag probe.
+
+    The CPU lane is warmed first when one of ``workflows`` uses it.
+    """
+    warm_cpu = Lane.CPU in {
+        TASK_LANES.get(workflow.name, Lane.ASYNC) for workflow in workflows
+    }
+
+    async def lifespan() -> AsyncIterator[None]:
+        if warm_cpu:
+            await asyncio.to_thread(LANES.warm_up)
+        monitor = LoopLagMonitor(
+            threshold_seconds=float(os.getenv("LOOP_LAG_THRESHOLD_SECONDS", "0.1"))
+        )
+        monitor.start()
+        try:
+            yield
+        finally:
+            await monitor.stop()
+            logger.info(
+                "Event loop lag probe: stalls=%d max_lag=%.3fs",
+                monitor.stalls,
+                monitor.max_lag_seconds,
+            )
+
+    return lifespan
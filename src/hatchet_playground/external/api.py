@@ -0,0 +1,241 @@
+import json
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Annotated, Any
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import StreamingResponse
+from hatchet_sdk import Hatchet
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import to_jsonable_python
+
+from hatchet_playground.external.run_events import RunEventBroadcaster
+from hatchet_playground.external.runner import TaskRunnerCache
+from hatchet_playground.external.status_watcher import RunStatusWatcher
+from hatchet_playground.external.task_schemas import (
+    TASK_SCHEMAS,
+    PayloadValidationError,
+)
+from hatchet_playground.external.trigger_batcher import TriggerBatcher
+
+
+class TriggerTaskRequest(BaseModel):
+    input_payload: dict[str, Any] = Field(default_factory=dict)
+    wait_for_completion: bool = False
+    poll_interval_seconds: float = Field(default=1.0, ge=0.1, le=30.0)
+    timeout_seconds: float = Field(default=300.0, gt=0, le=3600.0)
+
+
+class TriggerTaskResponse(BaseModel):
+    workflow_run_id: str
+    status: str | None = None
+    result: Any | None = None
+
+
+class TriggerManyTasksRequest(BaseModel):
+    input_payloads: list[dict[str, Any]] = Field(min_length=1)
+    keys: list[str] | None = None
+
+
+class TriggerManyTasksResponse(BaseModel):
+    workflow_run_ids: list[str]
+
+
+class RunStatusResponse(BaseModel):
+    workflow_run_id: str
+    status: str
+
+
+@dataclass
+class ApiServices:
+    hatchet: Hatchet
+    status_watcher: RunStatusWatcher
+    task_runners: TaskRunnerCache
+    trigger_batcher: TriggerBatcher
+    run_events: RunEventBroadcaster
+
+    @classmethod
+    def from_env(cls, hatchet: Hatchet) -> "ApiServices":
+        # NOTE: One watcher per process so concurrent waiters share batched status lookups.
+        status_watcher = RunStatusWatcher(hatchet.runs)
+        task_runners = TaskRunnerCache(hatchet=hatchet, status_watcher=status_watcher)
+        return cls(
+            hatchet=hatchet,
+            status_watcher=status_watcher,
+            task_runners=task_runners,
+            trigger_batcher=TriggerBatcher(
+                task_runners,
+                max_batch_size=int(os.getenv("TRIGGER_BATCH_MAX_SIZE", "100")),
+                max_wait_seconds=float(os.getenv("TRIGGER_BATCH_WINDOW_MS", "10"))
+                / 1000,
+            ),
+            run_events=RunEventBroadcaster(
+                hatchet, queue_size=int(os.getenv("RUN_EVENTS_QUEUE_SIZE", "100"))
+            ),
+        )
+
+    async def aclose(self) -> None:
+        await self.trigger_batcher.aclose()
+        await self.run_events.aclose()
+        await self.status_watcher.aclose()
+
+
+def get_services(request: Request) -> ApiServices:
+    return request.app.state.services
+
+
+Services = Annotated[ApiServices, Depends(get_services)]
+
+router = APIRouter()
+
+
+@router.get("/healthz")
+async def healthz() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@router.get("/tasks")
+async def list_tasks() -> dict[str, list[str]]:
+    return {"tasks": sorted(TASK_SCHEMAS.keys())}
+
+
+@router.post("/tasks/{task_name}/run", response_model=TriggerTaskResponse)
+async def run_task(
+    task_name: str, request: TriggerTaskRequest, services: Services
+) -> TriggerTaskResponse:
+    try:
+        workflow_run_ref = await services.trigger_batcher.submit(
+            task_name, request.input_payload
+        )
+    except ValidationError as exc:
+        # NOTE: Same error shape as /run-many, with the single payload at index 0.
+        errors = PayloadValidationError(
+            {0: exc.errors(include_url=False, include_input=False)}
+        )
+        raise HTTPException(status_code=422, detail=errors.to_jsonable()) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    if not request.wait_for_completion:
+        return TriggerTaskResponse(workflow_run_id=workflow_run_ref.workflow_run_id)
+
+    runner = services.task_runners.get(task_name)
+    try:
+        final_status = await runner.wait_for_terminal_status(
+            workflow_run_id=workflow_run_ref.workflow_run_id,
+            poll_interval_seconds=request.poll_interval_seconds,
+            timeout_seconds=request.timeout_seconds,
+        )
+    except TimeoutError as exc:
+        raise HTTPException(status_code=504, detail=str(exc)) from exc
+
+    if final_status.value != "COMPLETED":
+        return TriggerTaskResponse(
+            workflow_run_id=workflow_run_ref.workflow_run_id,
+            status=final_status.value,
+        )
+
+    result = await workflow_run_ref.aio_result()
+    return TriggerTaskResponse(
+        workflow_run_id=workflow_run_ref.workflow_run_id,
+        status=final_status.value,
+        result=to_jsonable_python(result),
+    )
+
+
+@router.post(
+    "/tasks/{task_name}/run-many",
+    response_model=TriggerManyTasksResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": TriggerManyTasksRequest.model_json_schema()
+                }
+            },
+        }
+    },
+)
+async def run_many_tasks(
+    task_name: str, request: Request, services: Services
+) -> TriggerManyTasksResponse:
+    # NOTE: The raw body is validated straight against the task's compiled input
+    # schema, so large bulk requests never materialize as intermediate dicts.
+    body = await request.body()
+    try:
+        runner = services.task_runners.get(task_name)
+        workflow_run_refs = await runner.trigger_many_json(body)
+    except PayloadValidationError as exc:
+        raise HTTPException(status_code=422, detail=exc.to_jsonable()) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return TriggerManyTasksResponse(
+        workflow_run_ids=[ref.workflow_run_id for ref in workflow_run_refs]
+    )
+
+
+@router.get("/runs/{workflow_run_id}/status", response_model=RunStatusResponse)
+async def run_status(workflow_run_id: str, services: Services) -> RunStatusResponse:
+    status = await services.hatchet.runs.aio_get_status(workflow_run_id)
+    return RunStatusResponse(workflow_run_id=workflow_run_id, status=status.value)
+
+
+async def _sse_messages(
+    run_events: RunEventBroadcaster, workflow_run_id: str
+) -> AsyncIterator[str]:
+    async for message in run_events.subscribe(workflow_run_id):
+        yield f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+
+@router.get("/runs/{workflow_run_id}/events")
+async def run_events_sse(workflow_run_id: str, services: Services) -> StreamingResponse:
+    return StreamingResponse(
+        _sse_messages(services.run_events, workflow_run_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/runs/{workflow_run_id}/events/ws")
+async def run_events_ws(websocket: WebSocket, workflow_run_id: str) -> None:
+    services: ApiServices = websocket.app.state.services
+    await websocket.accept()
+    try:
+        async for message in services.run_events.subscribe(workflow_run_id):
+            await websocket.send_json(message)
+    except WebSocketDisconnect:
+        return
+    await websocket.close()
+
+
+def create_app(hatchet: Hatchet) -> FastAPI:
+    """Build the trigger API around a Hatchet client.
+
+    The app has no import-time side effects, so it can be served against an
+    in-process fake client for offline benchmarks.
+    """
+    services = ApiServices.from_env(hatchet)
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        yield
+        await services.aclose()
+
+    app = FastAPI(
+        title="Hatchet External Trigger API", version="0.1.0", lifespan=lifespan
+    )
+    app.state.services = services
+    app.include_router(router)
+    return app
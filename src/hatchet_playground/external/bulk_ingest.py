@@ -0,0 +1,337 @@
+import asyncio
+import hashlib
+import itertools
+import json
+import logging
+import random
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol, TextIO
+
+from .task_schemas import PayloadValidationError
+
+# NOTE: Every run of a chunk carries the chunk's ID, so a retry can find the runs
+# an earlier, failed attempt already created.
+CHUNK_METADATA = "hatchet_playground_ingest_chunk"
+
+
+class BulkTriggerClient(Protocol):
+    """Subset of ``ExternalTaskRunner`` used by the ingestor."""
+
+    task_name: str
+
+    def validate_many(self, input_payloads: list[dict[str, Any]]) -> list[Any]: ...
+
+    async def trigger_validated_many(
+        self,
+        inputs: list[Any],
+        keys: list[str] | None = None,
+        additional_metadata: dict[str, str] | None = None,
+    ) -> list[Any]: ...
+
+    async def find_keyed_runs(
+        self, additional_metadata: dict[str, str], since: datetime
+    ) -> dict[str, str]: ...
+
+
+def idempotency_key(task_name: str, payload: dict[str, Any]) -> str:
+    """Derive a stable run key from the task name and canonical payload JSON."""
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    digest = hashlib.sha256(f"{task_name}\n{canonical}".encode()).hexdigest()
+    return f"{task_name}:{digest[:32]}"
+
+
+@dataclass(frozen=True)
+class _Line:
+    number: int
+    payload: dict[str, Any]
+    key: str
+
+
+@dataclass(frozen=True)
+class IngestSettings:
+    """Chunking and retry settings of a ``BulkIngestor``.
+
+    Attributes:
+        chunk_size: Payloads per bulk trigger call.
+        max_in_flight: Maximum chunks submitted concurrently.
+        max_attempts: Attempts per trigger call before its runs are reported failed.
+        base_backoff_seconds: Backoff cap of the first retry; doubles per retry.
+        max_backoff_seconds: Upper bound of the backoff cap.
+    """
+
+    chunk_size: int = 500
+    max_in_flight: int = 4
+    max_attempts: int = 5
+    base_backoff_seconds: float = 0.5
+    max_backoff_seconds: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.chunk_size <= 0 or self.max_in_flight <= 0 or self.max_attempts <= 0:
+            raise ValueError("chunk_size, max_in_flight and max_attempts must be > 0")
+        if (
+            self.base_backoff_seconds <= 0
+            or self.max_backoff_seconds < self.base_backoff_seconds
+        ):
+            raise ValueError(
+                "base_backoff_seconds must be > 0 and <= max_backoff_seconds"
+            )
+
+
+@dataclass
+class IngestStats:
+    read_lines: int = 0
+    submitted_runs: int = 0
+    recovered_runs: int = 0
+    duplicate_lines: int = 0
+    invalid_lines: int = 0
+    failed_runs: int = 0
+    chunks: int = 0
+    retries: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def runs_per_second(self) -> float:
+        if self.elapsed_seconds == 0:
+            return 0.0
+        return self.submitted_runs / self.elapsed_seconds
+
+
+class BulkIngestor:
+    def __init__(
+        self,
+        runner: BulkTriggerClient,
+        settings: IngestSettings | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Stream NDJSON payloads into bulk triggers with bounded memory.
+
+        Lines are read, validated and submitted one chunk at a time. At most
+        ``max_in_flight`` chunks are pending, and reading pauses until one
+        finishes, so memory stays flat however long the input is.
+
+        Failed chunks are retried with full-jitter exponential backoff. A failed
+        bulk call (a timeout, say) may still have created some runs, so every
+        run is tagged with its content-hash key (see ``idempotency_key``) and its
+        chunk's ID. Before each retry, the runs already tagged with the chunk ID
+        are looked up and their lines are not triggered again. Hatchet itself
+        does not dedupe on the key, so ingesting the same file twice triggers
+        its lines twice.
+
+        One JSON record per input line is written to the output as its chunk
+        completes: ``workflow_run_id`` on success, otherwise ``error`` or
+        ``duplicate_of``. Records of different chunks may be interleaved, so each
+        carries its ``line`` number.
+
+        Args:
+            runner: Runner for the target task.
+            settings: Chunking and retry settings. Defaults to ``IngestSettings()``.
+            logger: Optional logger instance. Defaults to module logger.
+        """
+        self.runner = runner
+        self.settings = settings or IngestSettings()
+        self.stats = IngestStats()
+        self._logger = logger or logging.getLogger(__name__)
+
+    async def ingest(self, lines: Iterable[str], output: TextIO) -> IngestStats:
+        """Submit every payload in ``lines`` and write one record per line."""
+        started = time.monotonic()
+        slots = asyncio.Semaphore(self.settings.max_in_flight)
+        in_flight: set[asyncio.Task[None]] = set()
+        numbered = enumerate(lines, start=1)
+
+        try:
+            while True:
+                await slots.acquire()
+                # NOTE: Read in a thread so a slow stdin does not stall in-flight chunks.
+                raw_lines = await asyncio.to_thread(
+                    list, itertools.islice(numbered, self.settings.chunk_size)
+                )
+                chunk = self._parse(raw_lines, output)
+                if not chunk:
+                    slots.release()
+                    if not raw_lines:
+                        break
+                    continue
+
+                task = asyncio.create_task(self._send(chunk, output))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                task.add_done_callback(lambda _: slots.release())
+
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            self.stats.elapsed_seconds = time.monotonic() - started
+
+        return self.stats
+
+    def _parse(self, raw_lines: list[tuple[int, str]], output: TextIO) -> list[_Line]:
+        chunk: list[_Line] = []
+        seen: dict[str, int] = {}
+        records: list[dict[str, Any]] = []
+
+        for number, raw_line in raw_lines:
+            if not raw_line.strip():
+                continue
+            self.stats.read_lines += 1
+            try:
+                payload = json.loads(raw_line)
+            except json.JSONDecodeError as exc:
+                self.stats.invalid_lines += 1
+                records.append({"line": number, "error": f"invalid JSON: {exc}"})
+                continue
+            if not isinstance(payload, dict):
+                self.stats.invalid_lines += 1
+                records.append({"line": number, "error": "expected a JSON object"})
+                continue
+
+            key = idempotency_key(self.runner.task_name, payload)
+            # Later copies of a payload within a chunk would only duplicate its run.
+            if key in seen:
+                self.stats.duplicate_lines += 1
+                records.append({"line": number, "key": key, "duplicate_of": seen[key]})
+                continue
+            seen[key] = number
+            chunk.append(_Line(number=number, payload=payload, key=key))
+
+        self._write(output, records)
+        return chunk
+
+    def _validate(
+        self, chunk: list[_Line], output: TextIO
+    ) -> tuple[list[_Line], list[Any]]:
+        try:
+            return chunk, self.runner.validate_many([line.payload for line in chunk])
+        except PayloadValidationError as exc:
+            errors = {
+                entry["index"]: entry["errors"]
+                for entry in exc.to_jsonable()
+                if entry["index"] is not None
+            }
+
+        self.stats.invalid_lines += len(errors)
+        self._write(
+            output,
+            [
+                {"line": chunk[index].number, "key": chunk[index].key, "error": error}
+                for index, error in sorted(errors.items())
+            ],
+        )
+        valid = [line for index, line in enumerate(chunk) if index not in errors]
+        if not valid:
+            return [], []
+        return valid, self.runner.validate_many([line.payload for line in valid])
+
+    async def _send(self, chunk: list[_Line], output: TextIO) -> None:
+        chunk, inputs = self._validate(chunk, output)
+        if not chunk:
+            return
+
+        self.stats.chunks += 1
+        settings = self.settings
+        chunk_tag = {CHUNK_METADATA: uuid.uuid4().hex}
+        # NOTE: Slack for clock skew between this host and the Hatchet server.
+        since = datetime.now(tz=UTC) - timedelta(minutes=5)
+        pending = {
+            line.key: (line, validated)
+            for line, validated in zip(chunk, inputs, strict=True)
+        }
+
+        for attempt in range(1, settings.max_attempts + 1):
+            try:
+                if attempt > 1:
+                    existing = await self.runner.find_keyed_runs(chunk_tag, since)
+                    self._recover(pending, existing, output)
+                if not pending:
+                    return
+                lines = [line for line, _ in pending.values()]
+                run_refs = await self.runner.trigger_validated_many(
+                    [validated for _, validated in pending.values()],
+                    list(pending),
+                    additional_metadata=chunk_tag,
+                )
+                break
+            except Exception as exc:
+                if attempt == settings.max_attempts:
+                    self._logger.exception(
+                        "Giving up on %d of lines %d-%d after %d attempts",
+                        len(pending),
+                        chunk[0].number,
+                        chunk[-1].number,
+                        attempt,
+                    )
+                    self.stats.failed_runs += len(pending)
+                    self._write(
+                        output,
+                        [
+                            {"line": line.number, "key": line.key, "error": str(exc)}
+                            for line, _ in pending.values()
+                        ],
+                    )
+                    return
+
+                cap = min(
+                    settings.max_backoff_seconds,
+                    settings.base_backoff_seconds * 2 ** (attempt - 1),
+                )
+                delay = random.uniform(0, cap)
+                self.stats.retries += 1
+                self._logger.warning(
+                    "Bulk trigger of lines %d-%d failed (attempt %d/%d), "
+                    "retrying in %.2fs: %s",
+                    chunk[0].number,
+                    chunk[-1].number,
+                    attempt,
+                    settings.max_attempts,
+                    delay,
+                    exc,
+                )
+                await asyncio.sleep(delay)
+
+        self.stats.submitted_runs += len(run_refs)
+        self._write(
+            output,
+            [
+                {
+                    "line": line.number,
+                    "key": line.key,
+                    "workflow_run_id": run_ref.workflow_run_id,
+                }
+                for line, run_ref in zip(lines, run_refs, strict=True)
+            ],
+        )
+
+    def _recover(
+        self,
+        pending: dict[str, tuple[_Line, Any]],
+        existing: dict[str, str],
+        output: TextIO,
+    ) -> None:
+        """Record and drop the pending lines a failed attempt already triggered."""
+        recovered = [pending.pop(key)[0] for key in list(pending) if key in existing]
+        self.stats.recovered_runs += len(recovered)
+        self._write(
+            output,
+            [
+                {
+                    "line": line.number,
+                    "key": line.key,
+                    "workflow_run_id": existing[line.key],
+                }
+                for line in recovered
+            ],
+        )
+
+    def _write(self, output: TextIO, records: list[dict[str, Any]]) -> None:
+        if not records:
+            return
+        output.write("".join(json.dumps(record) + "\n" for record in records))
+        output.flush()
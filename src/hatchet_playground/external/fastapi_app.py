@@ -1,101 +1,23 @@
 import os
-from typing import Any
 
-from fastapi import FastAPI, HTTPException
-from hatchet_sdk import Hatchet
-from hatchet_sdk.opentelemetry.instrumentor import HatchetInstrumentor
-from langfuse import Langfuse
+from fastapi import FastAPI
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.trace import get_tracer_provider
-from pydantic import BaseModel, Field
 
-from hatchet_playground.external.runner import ExternalTaskRunner
-from hatchet_playground.external.task_schemas import TASK_SCHEMAS
+from hatchet_playground.external.api import create_app
+from hatchet_playground.hatchet_client import get_hatchet
 
-# NOTE: Langfuse must be initialized before Hatchet and FastAPI object creation to ensure proper tracing integration.
-lf = Langfuse()
 
-HatchetInstrumentor(tracer_provider=get_tracer_provider()).instrument()
+def build_app() -> FastAPI:
+    """Create the instrumented trigger API.
 
-hatchet = Hatchet(debug=False)
-app = FastAPI(title="Hatchet External Trigger API", version="0.1.0")
-FastAPIInstrumentor.instrument_app(app, tracer_provider=get_tracer_provider())
-
-
-class TriggerTaskRequest(BaseModel):
-    input_payload: dict[str, Any] = Field(default_factory=dict)
-    wait_for_completion: bool = False
-    poll_interval_seconds: float = Field(default=1.0, ge=0.1, le=30.0)
-
-
-class TriggerTaskResponse(BaseModel):
-    workflow_run_id: str
-    status: str | None = None
-    result: Any | None = None
-
-
-class RunStatusResponse(BaseModel):
-    workflow_run_id: str
-    status: str
-
-
-def _serialize_result(value: BaseModel) -> dict[str, Any]:
-    if not isinstance(value, BaseModel):
-        raise TypeError(
-            f"Expected Pydantic BaseModel result, got {type(value).__name__}"
-        )
-    return value.model_dump()
-
-
-@app.get("/healthz")
-async def healthz() -> dict[str, str]:
-    return {"status": "ok"}
-
-
-@app.get("/tasks")
-async def list_tasks() -> dict[str, list[str]]:
-    return {"tasks": sorted(TASK_SCHEMAS.keys())}
-
-
-@app.post("/tasks/{task_name}/run", response_model=TriggerTaskResponse)
-async def run_task(task_name: str, request: TriggerTaskRequest) -> TriggerTaskResponse:
-    runner = ExternalTaskRunner(
-        task_name=task_name,
-        input_payload=request.input_payload,
-        hatchet=hatchet,
-    )
-
-    try:
-        workflow_run_ref = await runner.trigger_no_wait()
-    except Exception as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-    if not request.wait_for_completion:
-        return TriggerTaskResponse(workflow_run_id=workflow_run_ref.workflow_run_id)
-
-    final_status = await runner.wait_for_terminal_status(
-        workflow_run_id=workflow_run_ref.workflow_run_id,
-        poll_interval_seconds=request.poll_interval_seconds,
-    )
-
-    if final_status.value != "COMPLETED":
-        return TriggerTaskResponse(
-            workflow_run_id=workflow_run_ref.workflow_run_id,
-            status=final_status.value,
-        )
-
-    result = await workflow_run_ref.aio_result()
-    return TriggerTaskResponse(
-        workflow_run_id=workflow_run_ref.workflow_run_id,
-        status=final_status.value,
-        result=_serialize_result(result),
-    )
-
-
-@app.get("/runs/{workflow_run_id}/status", response_model=RunStatusResponse)
-async def run_status(workflow_run_id: str) -> RunStatusResponse:
-    status = await hatchet.runs.aio_get_status(workflow_run_id)
-    return RunStatusResponse(workflow_run_id=workflow_run_id, status=status.value)
+    Telemetry is initialized here rather than at import, so importing this module
+    has no side effects. Serve with ``uvicorn --factory ...fastapi_app:build_app``.
+    """
+    # NOTE: get_hatchet() initializes Langfuse before Hatchet and FastAPI object creation to ensure proper tracing integration.
+    app = create_app(get_hatchet())
+    FastAPIInstrumentor.instrument_app(app, tracer_provider=get_tracer_provider())
+    return app
 
 
 if __name__ == "__main__":
@@ -104,4 +26,4 @@ if __name__ == "__main__":
 
     import uvicorn
 
-    uvicorn.run(app, host=uvicorn_host, port=uvicorn_port)
+    uvicorn.run(build_app(), host=uvicorn_host, port=uvicorn_port)
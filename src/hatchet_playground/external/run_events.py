@@ -0,0 +1,151 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from hatchet_sdk import Hatchet
+from hatchet_sdk.clients.rest.models.v1_task_status import V1TaskStatus
+from pydantic_core import to_jsonable_python
+
+FINAL_MESSAGE_TYPES = {"final", "error"}
+
+
+@dataclass(eq=False)
+class _Subscriber:
+    queue: asyncio.Queue[dict[str, Any]]
+    dropped: int = 0
+
+
+@dataclass
+class _RunChannel:
+    subscribers: set[_Subscriber] = field(default_factory=set)
+    task: asyncio.Task[None] | None = None
+
+
+class RunEventBroadcaster:
+    def __init__(
+        self,
+        hatchet: Hatchet,
+        queue_size: int = 100,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Fan out one upstream run event stream to any number of subscribers.
+
+        Each subscriber gets a bounded queue. When a slow consumer's queue is
+        full, its oldest queued message is dropped so the upstream stream and
+        other subscribers never wait on it. The final message (run status plus
+        serialized result) is always delivered.
+
+        Args:
+            hatchet: Shared Hatchet client instance.
+            queue_size: Maximum buffered messages per subscriber.
+            logger: Optional logger instance. Defaults to module logger.
+
+        Raises:
+            ValueError: If ``queue_size`` is not positive.
+        """
+        if queue_size <= 0:
+            raise ValueError("queue_size must be > 0")
+
+        self.hatchet = hatchet
+        self.queue_size = queue_size
+        self._logger = logger or logging.getLogger(__name__)
+        self._channels: dict[str, _RunChannel] = {}
+
+    def subscriber_count(self, workflow_run_id: str) -> int:
+        channel = self._channels.get(workflow_run_id)
+        return 0 if channel is None else len(channel.subscribers)
+
+    async def subscribe(self, workflow_run_id: str) -> AsyncIterator[dict[str, Any]]:
+        """Yield run event messages, ending with a ``final`` or ``error`` message."""
+        subscriber = _Subscriber(queue=asyncio.Queue(maxsize=self.queue_size))
+        channel = self._channels.get(workflow_run_id)
+        if channel is None:
+            channel = _RunChannel()
+            self._channels[workflow_run_id] = channel
+        channel.subscribers.add(subscriber)
+
+        if channel.task is None:
+            channel.task = asyncio.get_running_loop().create_task(
+                self._pump(workflow_run_id, channel)
+            )
+
+        try:
+            while True:
+                message = await subscriber.queue.get()
+                if message["type"] in FINAL_MESSAGE_TYPES:
+                    yield {**message, "dropped": subscriber.dropped}
+                    return
+                yield message
+        finally:
+            await self._unsubscribe(workflow_run_id, channel, subscriber)
+
+    async def aclose(self) -> None:
+        """Cancel all upstream streams."""
+        tasks = [c.task for c in self._channels.values() if c.task is not None]
+        self._channels.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _unsubscribe(
+        self, workflow_run_id: str, channel: _RunChannel, subscriber: _Subscriber
+    ) -> None:
+        channel.subscribers.discard(subscriber)
+        if channel.subscribers or self._channels.get(workflow_run_id) is not channel:
+            return
+
+        # Last subscriber left: stop the upstream stream for this run.
+        del self._channels[workflow_run_id]
+        if channel.task is not None and not channel.task.done():
+            channel.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await channel.task
+
+    def _publish(self, channel: _RunChannel, message: dict[str, Any]) -> None:
+        for subscriber in channel.subscribers:
+            if subscriber.queue.full():
+                subscriber.queue.get_nowait()
+                subscriber.dropped += 1
+            subscriber.queue.put_nowait(message)
+
+    async def _pump(self, workflow_run_id: str, channel: _RunChannel) -> None:
+        try:
+            run_ref = self.hatchet.runs.get_run_ref(workflow_run_id)
+            async for event in run_ref.stream():
+                self._publish(
+                    channel,
+                    {
+                        "type": "event",
+                        "event": event.type.value,
+                        "payload": event.payload,
+                    },
+                )
+
+            status = await self.hatchet.runs.aio_get_status(workflow_run_id)
+            result = None
+            if status == V1TaskStatus.COMPLETED:
+                result = to_jsonable_python(await run_ref.aio_result())
+        except Exception as exc:
+            self._logger.exception(
+                "Event stream failed for workflow_run_id=%s", workflow_run_id
+            )
+            self._publish(channel, {"type": "error", "detail": str(exc)})
+        else:
+            self._publish(
+                channel,
+                {
+                    "type": "final",
+                    "workflow_run_id": workflow_run_id,
+                    "status": status.value,
+                    "result": result,
+                },
+            )
+        finally:
+            # Later subscribers start a fresh upstream stream.
+            if self._channels.get(workflow_run_id) is channel:
+                del self._channels[workflow_run_id]
@@ -1,22 +1,30 @@
 import argparse
 import asyncio
+import contextlib
 import json
 import logging
 import sys
 import time
-from typing import Any
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TextIO
 
-from hatchet_sdk import EmptyModel, Hatchet
+from hatchet_sdk import Hatchet, TriggerWorkflowOptions
 from hatchet_sdk.clients.rest.models.v1_task_status import V1TaskStatus
-from pydantic import BaseModel
 
-from .task_schemas import TASK_SCHEMAS, TaskSchema, resolve_task_schema
+from .bulk_ingest import BulkIngestor, IngestSettings
+from .status_watcher import TERMINAL_STATUSES, WATCH_METADATA, RunStatusWatcher
+from .task_schemas import (
+    TASK_SCHEMAS,
+    TaskSchema,
+    input_adapter,
+    resolve_task_schema,
+)
 
-TERMINAL_STATUSES = {
-    V1TaskStatus.COMPLETED,
-    V1TaskStatus.FAILED,
-    V1TaskStatus.CANCELLED,
-}
+# NOTE: hatchet-sdk 1.24 never sends ``TriggerWorkflowOptions.key``, so run keys are
+# kept in the run's metadata, where they can be looked up.
+RUN_KEY_METADATA = "hatchet_playground_key"
 
 
 class ExternalTaskRunner:
@@ -30,6 +38,9 @@ class ExternalTaskRunner:
     ) -> None:
         """Initialize a task runner for externally triggering Hatchet tasks.
 
+        Set ``status_watcher`` to a shared ``RunStatusWatcher`` to wait for runs
+        through its batched polling instead of per-run status calls.
+
         Args:
             task_name: Registered Hatchet task name to trigger.
             input_payload: Raw input payload to validate/serialize.
@@ -42,7 +53,9 @@ class ExternalTaskRunner:
         self.input_payload = input_payload
         self.stream = stream
         self._logger = logger or logging.getLogger(__name__)
+        self.status_watcher: RunStatusWatcher | None = None
         self._schema = resolve_task_schema(task_name)
+        self._input_adapter = input_adapter(self._schema.input_validator)
         self._stub = self._create_stub(self._schema)
 
     def _create_stub(self, schema: TaskSchema):
@@ -67,27 +80,26 @@ class ExternalTaskRunner:
 
         Returns:
             The validated input object expected by Hatchet.
-
-        Raises:
-            TypeError: If the task schema validator type is unsupported.
         """
-        validator = self._schema.input_validator
         payload = self.input_payload if input_payload is None else input_payload
-
-        if validator is EmptyModel:
-            return EmptyModel()
-
-        if isinstance(validator, type) and issubclass(validator, BaseModel):
-            return validator.model_validate(payload)
-
-        raise TypeError(
-            f"Unsupported input validator type for task={self.task_name}. "
-            "Only Pydantic BaseModel and EmptyModel are supported."
-        )
+        return self._input_adapter.validate(payload)
 
     async def trigger_no_wait(self):
         """Trigger one run and return immediately with a run reference."""
-        return await self._stub.aio_run_no_wait(input=self._build_input())
+        return await self._stub.aio_run_no_wait(
+            input=self._build_input(), options=self._trigger_options()
+        )
+
+    def _trigger_options(
+        self,
+        key: str | None = None,
+        additional_metadata: dict[str, str] | None = None,
+    ) -> TriggerWorkflowOptions:
+        # Tag runs so the status watcher can find them without a tenant-wide scan.
+        metadata = {**WATCH_METADATA, **(additional_metadata or {})}
+        if key is not None:
+            metadata[RUN_KEY_METADATA] = key
+        return TriggerWorkflowOptions(additional_metadata=metadata)
 
     async def trigger_many_no_wait(
         self, input_payloads: list[dict[str, Any]], keys: list[str] | None = None
@@ -96,24 +108,112 @@ class ExternalTaskRunner:
 
         Args:
             input_payloads: Payloads to validate and submit in one bulk call.
-            keys: Optional dedupe/idempotency keys, one per payload.
+            keys: Optional run keys, one per payload. They are stored in the run's
+                ``hatchet_playground_key`` metadata; Hatchet does not dedupe on them.
 
         Returns:
             A list of run references in submission order.
 
         Raises:
             ValueError: If ``keys`` length does not match payload count.
+            PayloadValidationError: If any payload is invalid; nothing is submitted.
+        """
+        return await self.trigger_validated_many(
+            self.validate_many(input_payloads), keys
+        )
+
+    async def trigger_many_json(self, data: str | bytes) -> list[Any]:
+        """Trigger many runs from a raw ``{"input_payloads": [...]}`` JSON body.
+
+        Raises:
+            ValueError: If ``keys`` length does not match payload count.
+            PayloadValidationError: If the body or any payload is invalid.
         """
-        if keys is not None and len(keys) != len(input_payloads):
+        inputs, keys = self._input_adapter.validate_bulk_json(data)
+        return await self.trigger_validated_many(inputs, keys)
+
+    def validate_many(self, input_payloads: list[dict[str, Any]]) -> list[Any]:
+        """Validate payloads in one call without triggering anything.
+
+        Raises:
+            PayloadValidationError: With the errors of every invalid payload.
+        """
+        return self._input_adapter.validate_many(input_payloads)
+
+    async def trigger_validated_many(
+        self,
+        inputs: list[Any],
+        keys: list[str] | None = None,
+        additional_metadata: dict[str, str] | None = None,
+    ) -> list[Any]:
+        """Trigger runs for inputs already returned by ``validate_many``.
+
+        Args:
+            inputs: Validated task inputs.
+            keys: Optional run keys, one per input.
+            additional_metadata: Extra metadata set on every triggered run.
+
+        Raises:
+            ValueError: If ``keys`` length does not match input count.
+        """
+        if keys is not None and len(keys) != len(inputs):
             raise ValueError("keys must have the same length as input_payloads")
 
         bulk_items = [
-            self._stub.create_bulk_run_item(
-                input=self._build_input(payload),
-                key=None if keys is None else keys[index],
+            self._bulk_item(
+                validated,
+                None if keys is None else keys[index],
+                additional_metadata,
             )
-            for index, payload in enumerate(input_payloads)
+            for index, validated in enumerate(inputs)
         ]
+        return await self.trigger_bulk_items(bulk_items)
+
+    async def find_keyed_runs(
+        self, additional_metadata: dict[str, str], since: datetime
+    ) -> dict[str, str]:
+        """Map run keys to run IDs for runs triggered with ``additional_metadata``.
+
+        Args:
+            additional_metadata: Metadata the runs were triggered with.
+            since: Lower bound for the runs' creation time.
+        """
+        found: dict[str, str] = {}
+        offset, page_size = 0, 500
+        while True:
+            page = await self.hatchet.runs.aio_list(
+                since=since,
+                offset=offset,
+                limit=page_size,
+                additional_metadata=additional_metadata,
+                include_payloads=False,
+            )
+            for row in page.rows:
+                key = (row.additional_metadata or {}).get(RUN_KEY_METADATA)
+                if key is not None:
+                    found.setdefault(key, row.workflow_run_external_id)
+            if len(page.rows) < page_size:
+                return found
+            offset += page_size
+
+    def create_bulk_item(
+        self, input_payload: dict[str, Any], key: str | None = None
+    ) -> Any:
+        """Validate one payload and wrap it as a bulk run item."""
+        return self._bulk_item(self._build_input(input_payload), key)
+
+    def _bulk_item(
+        self,
+        validated: Any,
+        key: str | None,
+        additional_metadata: dict[str, str] | None = None,
+    ) -> Any:
+        return self._stub.create_bulk_run_item(
+            input=validated, options=self._trigger_options(key, additional_metadata)
+        )
+
+    async def trigger_bulk_items(self, bulk_items: list[Any]) -> list[Any]:
+        """Submit prepared bulk run items in one call and return run references."""
         return await self._stub.aio_run_many_no_wait(bulk_items)
 
     async def wait_for_terminal_status(
@@ -124,6 +224,10 @@ class ExternalTaskRunner:
     ) -> V1TaskStatus:
         """Poll a run until it reaches a terminal status.
 
+        When a shared ``status_watcher`` is configured, the run is registered with
+        it and ``poll_interval_seconds`` is ignored in favor of its batched,
+        age-based polling.
+
         Raises:
             ValueError: If poll interval is non-positive.
             TimeoutError: If timeout elapses before a terminal status is reached.
@@ -131,6 +235,12 @@ class ExternalTaskRunner:
         if poll_interval_seconds <= 0:
             raise ValueError("poll_interval_seconds must be > 0")
 
+        if self.status_watcher is not None:
+            watched = await self.status_watcher.watch(
+                workflow_run_id, timeout_seconds=timeout_seconds
+            )
+            return watched.status
+
         started = time.monotonic()
         while True:
             status = await self.hatchet.runs.aio_get_status(workflow_run_id)
@@ -205,6 +315,44 @@ class ExternalTaskRunner:
         return outcome
 
 
+class TaskRunnerCache:
+    def __init__(
+        self,
+        hatchet: Hatchet,
+        status_watcher: RunStatusWatcher | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Cache one runner per task name so schemas and stubs are built once.
+
+        Cached runners carry an empty default payload; trigger them through the
+        payload-taking bulk methods. Only names in ``TASK_SCHEMAS`` are cached so
+        arbitrary request paths cannot grow the cache.
+
+        Args:
+            hatchet: Shared Hatchet client instance.
+            status_watcher: Optional shared watcher passed to every runner.
+            logger: Optional logger instance passed to every runner.
+        """
+        self.hatchet = hatchet
+        self.status_watcher = status_watcher
+        self._logger = logger
+        self._runners: dict[str, ExternalTaskRunner] = {}
+
+    def get(self, task_name: str) -> ExternalTaskRunner:
+        runner = self._runners.get(task_name)
+        if runner is None:
+            runner = ExternalTaskRunner(
+                task_name=task_name,
+                input_payload={},
+                hatchet=self.hatchet,
+                logger=self._logger,
+            )
+            runner.status_watcher = self.status_watcher
+            if task_name in TASK_SCHEMAS:
+                self._runners[task_name] = runner
+        return runner
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument("--task-name", required=True)
@@ -219,6 +367,18 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="List configured task names and exit",
     )
+    parser.add_argument(
+        "--input-file",
+        help="Bulk ingest NDJSON payloads, one object per line ('-' for stdin)",
+    )
+    parser.add_argument(
+        "--output-file",
+        default="-",
+        help="NDJSON record per input line with its run ID or error ('-' for stdout)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--max-in-flight", type=int, default=4)
+    parser.add_argument("--max-attempts", type=int, default=5)
     return parser.parse_args()
 
 
@@ -233,6 +393,25 @@ def parse_input_json(input_json: str) -> dict[str, Any]:
     return parsed
 
 
+async def ingest_file(
+    args: argparse.Namespace, input_file: TextIO, output_file: TextIO
+) -> int:
+    """Bulk ingest ``input_file`` and return the process exit code."""
+    ingestor = BulkIngestor(
+        ExternalTaskRunner(task_name=args.task_name, input_payload={}),
+        IngestSettings(
+            chunk_size=args.chunk_size,
+            max_in_flight=args.max_in_flight,
+            max_attempts=args.max_attempts,
+        ),
+    )
+    stats = await ingestor.ingest(input_file, output_file)
+
+    summary = {**asdict(stats), "runs_per_second": stats.runs_per_second}
+    sys.stderr.write(json.dumps(summary) + "\n")
+    return 1 if stats.invalid_lines or stats.failed_runs else 0
+
+
 if __name__ == "__main__":
     args = parse_args()
 
@@ -241,6 +420,22 @@ if __name__ == "__main__":
             sys.stdout.write(f"{task_name}\n")
         raise SystemExit(0)
 
+    if args.input_file is not None:
+        with contextlib.ExitStack() as files:
+            input_file = (
+                sys.stdin
+                if args.input_file == "-"
+                else files.enter_context(Path(args.input_file).open(encoding="utf-8"))
+            )
+            output_file = (
+                sys.stdout
+                if args.output_file == "-"
+                else files.enter_context(
+                    Path(args.output_file).open("w", encoding="utf-8")
+                )
+            )
+            raise SystemExit(asyncio.run(ingest_file(args, input_file, output_file)))
+
     runner = ExternalTaskRunner(
         task_name=args.task_name,
         input_payload=parse_input_json(args.input_json),
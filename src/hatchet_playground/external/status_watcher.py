@@ -0,0 +1,355 @@
+import asyncio
+import contextlib
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, Protocol
+
+from hatchet_sdk.clients.rest.models.v1_task_status import V1TaskStatus
+
+TERMINAL_STATUSES = {
+    V1TaskStatus.COMPLETED,
+    V1TaskStatus.FAILED,
+    V1TaskStatus.CANCELLED,
+}
+
+
+# NOTE: Runs triggered by this process carry this metadata so watcher queries only
+# scan the process's own runs instead of every terminal run in the tenant.
+WATCH_METADATA: dict[str, str] = {"hatchet_playground_watch": uuid.uuid4().hex}
+
+
+class RunsListClient(Protocol):
+    """Subset of ``hatchet.runs`` used by the watcher.
+
+    ``aio_list`` is called with the ``since``, ``offset``, ``limit``,
+    ``additional_metadata`` and ``include_payloads`` filters.
+    Anything exposing compatible methods works, so the watcher can run against
+    an in-memory fake instead of a Hatchet server.
+    """
+
+    async def aio_list(self, *args: Any, **kwargs: Any) -> Any: ...
+
+    async def aio_get_status(self, workflow_run_id: str) -> V1TaskStatus: ...
+
+
+@dataclass(frozen=True)
+class WatchedRun:
+    workflow_run_id: str
+    status: V1TaskStatus
+    api_calls: float
+    elapsed_seconds: float
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+@dataclass
+class _PendingRun:
+    future: asyncio.Future[WatchedRun]
+    since: datetime
+    registered_at: float
+    next_check_at: float
+    api_calls: float = 0.0
+    waiters: int = 0
+    missed_rounds: int = 0
+
+
+@dataclass(frozen=True)
+class WatcherSettings:
+    """Polling settings of a ``RunStatusWatcher``.
+
+    Attributes:
+        min_interval_seconds: Poll interval for freshly registered runs.
+        max_interval_seconds: Upper bound for the poll interval of old runs.
+        backoff_ratio: Poll interval as a fraction of a run's age.
+        page_size: Rows requested per ``aio_list`` call.
+        max_pages_per_round: Maximum ``aio_list`` calls in one round.
+        lookback_seconds: How far before registration to search for a run.
+        fallback_after_rounds: Consecutive rounds a run may be absent from the
+            listing before it is polled with ``aio_get_status`` instead.
+    """
+
+    min_interval_seconds: float = 0.5
+    max_interval_seconds: float = 10.0
+    backoff_ratio: float = 0.1
+    page_size: int = 500
+    max_pages_per_round: int = 20
+    lookback_seconds: float = 60.0
+    fallback_after_rounds: int = 3
+
+    def __post_init__(self) -> None:
+        if self.min_interval_seconds <= 0:
+            raise ValueError("min_interval_seconds must be > 0")
+        if self.max_interval_seconds < self.min_interval_seconds:
+            raise ValueError("max_interval_seconds must be >= min_interval_seconds")
+        if self.page_size <= 0 or self.max_pages_per_round <= 0:
+            raise ValueError("page_size and max_pages_per_round must be > 0")
+        if self.fallback_after_rounds <= 0:
+            raise ValueError("fallback_after_rounds must be > 0")
+
+
+@dataclass
+class WatcherStats:
+    list_calls: int = 0
+    status_calls: int = 0
+    completed_runs: int = 0
+    failed_rounds: int = 0
+    resolved_api_calls: float = 0.0
+
+    @property
+    def api_calls_per_run(self) -> float:
+        if self.completed_runs == 0:
+            return 0.0
+        return self.resolved_api_calls / self.completed_runs
+
+
+class RunStatusWatcher:
+    def __init__(
+        self,
+        runs_client: RunsListClient,
+        settings: WatcherSettings | None = None,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Initialize a process-wide watcher that resolves runs in batches.
+
+        Every polling round issues one paginated ``aio_list`` query for the runs
+        tagged with ``WATCH_METADATA``, in any status, and resolves all pending
+        waiters whose run is terminal, instead of one ``aio_get_status`` call per
+        run. Runs that are still queued or running stay on the listing however
+        long they take. Only runs absent from the listing for
+        ``fallback_after_rounds`` consecutive rounds (triggered elsewhere, or
+        beyond the page budget) are polled individually with ``aio_get_status``.
+
+        Args:
+            runs_client: Client exposing ``aio_list``, usually ``hatchet.runs``.
+            settings: Polling settings. Defaults to ``WatcherSettings()``.
+            logger: Optional logger instance. Defaults to module logger.
+        """
+        self.runs_client = runs_client
+        self.settings = settings or WatcherSettings()
+        self.lookback = timedelta(seconds=self.settings.lookback_seconds)
+        self.stats = WatcherStats()
+        self._logger = logger or logging.getLogger(__name__)
+        self._pending: dict[str, _PendingRun] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def watch(
+        self,
+        workflow_run_id: str,
+        timeout_seconds: float | None = None,
+        since: datetime | None = None,
+    ) -> WatchedRun:
+        """Register a run and wait until it reaches a terminal status.
+
+        Args:
+            workflow_run_id: Workflow run ID to watch.
+            timeout_seconds: Optional maximum time to wait.
+            since: Optional lower bound for the run's creation time. Defaults to
+                registration time minus ``lookback_seconds``.
+
+        Raises:
+            TimeoutError: If timeout elapses before a terminal status is reached.
+        """
+        pending = self._pending.get(workflow_run_id)
+        if pending is None:
+            now = time.monotonic()
+            pending = _PendingRun(
+                future=asyncio.get_running_loop().create_future(),
+                since=since or datetime.now(tz=UTC) - self.lookback,
+                registered_at=now,
+                next_check_at=now + self.settings.min_interval_seconds,
+            )
+            self._pending[workflow_run_id] = pending
+            self._ensure_started()
+            self._wakeup.set()
+
+        pending.waiters += 1
+        try:
+            # Shield so one waiter leaving does not cancel the shared future.
+            return await asyncio.wait_for(
+                asyncio.shield(pending.future), timeout=timeout_seconds
+            )
+        except TimeoutError:
+            raise TimeoutError(
+                f"Timed out waiting for workflow_run_id={workflow_run_id} "
+                f"after {timeout_seconds:.1f}s"
+            ) from None
+        finally:
+            pending.waiters -= 1
+            if pending.waiters == 0:
+                self._discard(workflow_run_id, pending)
+
+    async def aclose(self) -> None:
+        """Stop the polling loop and cancel all outstanding waiters."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        for pending in self._pending.values():
+            pending.future.cancel()
+        self._pending.clear()
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run_loop())
+
+    def _discard(self, workflow_run_id: str, pending: _PendingRun) -> None:
+        if self._pending.get(workflow_run_id) is pending and not pending.future.done():
+            pending.future.cancel()
+            del self._pending[workflow_run_id]
+
+    def _next_interval(self, age_seconds: float) -> float:
+        settings = self.settings
+        interval = age_seconds * settings.backoff_ratio
+        return min(
+            settings.max_interval_seconds,
+            max(settings.min_interval_seconds, interval),
+        )
+
+    async def _run_loop(self) -> None:
+        while self._pending:
+            now = time.monotonic()
+            due = {
+                run_id: pending
+                for run_id, pending in self._pending.items()
+                if pending.next_check_at <= now
+            }
+
+            if not due:
+                next_check_at = min(p.next_check_at for p in self._pending.values())
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=next_check_at - now
+                    )
+                continue
+
+            await self._poll_round(due)
+
+    async def _poll_round(self, due: dict[str, _PendingRun]) -> None:
+        fallback_after = self.settings.fallback_after_rounds
+        direct = [
+            run_id
+            for run_id, pending in due.items()
+            if pending.missed_rounds >= fallback_after
+        ]
+        # A listing costs the same however many runs it covers, so once one
+        # listed run is due, every listed run is checked in the same round.
+        listed: dict[str, _PendingRun] = {}
+        if len(direct) < len(due):
+            listed = {
+                run_id: pending
+                for run_id, pending in self._pending.items()
+                if pending.missed_rounds < fallback_after
+            }
+        checked = {**listed, **{run_id: due[run_id] for run_id in direct}}
+
+        found: dict[str, V1TaskStatus | Any] = {}
+        calls = 0
+        failed = False
+        try:
+            if listed:
+                since = min(pending.since for pending in listed.values())
+                found, calls = await self._list_runs(since, set(listed))
+            if direct:
+                found.update(await self._get_statuses(direct))
+        except Exception:
+            failed = True
+            self.stats.failed_rounds += 1
+            self._logger.exception(
+                "Status watcher round failed for %d runs", len(checked)
+            )
+
+        self.stats.list_calls += calls
+        now = time.monotonic()
+        share = calls / len(listed) if listed else 0.0
+
+        for run_id, pending in checked.items():
+            if self._pending.get(run_id) is not pending:
+                continue  # All waiters left while the round was in flight.
+            pending.api_calls += share if run_id in listed else 1.0
+            result = found.get(run_id)
+            if run_id in listed and not failed:
+                # Only a run the listing did not cover counts as missed.
+                pending.missed_rounds = (
+                    0 if result is not None else pending.missed_rounds + 1
+                )
+            status = getattr(result, "status", result)
+            if status not in TERMINAL_STATUSES:
+                age = now - pending.registered_at
+                pending.next_check_at = now + self._next_interval(age)
+                continue
+            self._resolve(run_id, pending, result, now)
+
+    async def _list_runs(
+        self, since: datetime, wanted: set[str]
+    ) -> tuple[dict[str, Any], int]:
+        found: dict[str, Any] = {}
+        calls = 0
+        offset = 0
+        page_size = self.settings.page_size
+
+        while calls < self.settings.max_pages_per_round and len(found) < len(wanted):
+            page = await self.runs_client.aio_list(
+                since=since,
+                offset=offset,
+                limit=page_size,
+                additional_metadata=WATCH_METADATA,
+                include_payloads=False,
+            )
+            calls += 1
+
+            for row in page.rows:
+                for run_id in (row.workflow_run_external_id, row.metadata.id):
+                    if run_id in wanted:
+                        found[run_id] = row
+
+            if len(page.rows) < page_size:
+                break
+            offset += page_size
+
+        return found, calls
+
+    async def _get_statuses(self, run_ids: list[str]) -> dict[str, V1TaskStatus]:
+        statuses = await asyncio.gather(
+            *(self.runs_client.aio_get_status(run_id) for run_id in run_ids)
+        )
+        self.stats.status_calls += len(run_ids)
+        return dict(zip(run_ids, statuses, strict=True))
+
+    def _resolve(
+        self, run_id: str, pending: _PendingRun, result: Any, now: float
+    ) -> None:
+        """Resolve ``pending`` from a listed run row or a bare status."""
+        del self._pending[run_id]
+
+        row = None if isinstance(result, V1TaskStatus) else result
+        watched = WatchedRun(
+            workflow_run_id=run_id,
+            status=result if row is None else row.status,
+            api_calls=pending.api_calls,
+            elapsed_seconds=now - pending.registered_at,
+            created_at=getattr(row, "created_at", None),
+            started_at=getattr(row, "started_at", None),
+            finished_at=getattr(row, "finished_at", None),
+        )
+        self.stats.completed_runs += 1
+        self.stats.resolved_api_calls += watched.api_calls
+        self._logger.info(
+            "workflow_run_id=%s status=%s api_calls=%.2f elapsed=%.2fs",
+            run_id,
+            watched.status.value,
+            watched.api_calls,
+            watched.elapsed_seconds,
+        )
+        pending.future.set_result(watched)
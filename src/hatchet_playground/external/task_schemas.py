@@ -1,15 +1,14 @@
-from typing import Any
-
-from hatchet_schemas import (
-    ChatOtelInput,
-    ChatOtelOutput,
-    ExternallyTriggeredTaskInput,
-    ExternallyTriggeredTaskOutput,
-    SayHelloInput,
-    SayHelloOutput,
-)
+import dataclasses
+from functools import cache
+from typing import Any, Generic, TypeVar
+
 from hatchet_sdk import EmptyModel
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+from hatchet_playground.registry import WORKFLOWS
+
+T = TypeVar("T")
 
 
 class TaskSchema(BaseModel):
@@ -22,23 +21,148 @@ class TaskSchema(BaseModel):
 DEFAULT_TASK_SCHEMA = TaskSchema(input_validator=EmptyModel)
 
 TASK_SCHEMAS: dict[str, TaskSchema] = {
-    "externally-triggered-task": TaskSchema(
-        input_validator=ExternallyTriggeredTaskInput,
-        output_validator=ExternallyTriggeredTaskOutput,
-    ),
-    "first-workflow": TaskSchema(input_validator=EmptyModel),
-    "say_hello": TaskSchema(
-        input_validator=SayHelloInput,
-        output_validator=SayHelloOutput,
-    ),
-    "sync-sleep-task": TaskSchema(input_validator=EmptyModel),
-    "cpu-heavy-with-process-pool": TaskSchema(input_validator=EmptyModel),
-    "chat-otel": TaskSchema(
-        input_validator=ChatOtelInput,
-        output_validator=ChatOtelOutput,
-    ),
+    task_name: TaskSchema(
+        input_validator=spec.input_validator,
+        output_validator=spec.output_validator,
+    )
+    for task_name, spec in WORKFLOWS.items()
 }
 
 
 def resolve_task_schema(task_name: str) -> TaskSchema:
     return TASK_SCHEMAS.get(task_name, DEFAULT_TASK_SCHEMA)
+
+
+class PayloadValidationError(ValueError):
+    def __init__(self, errors: dict[int | None, list[ErrorDetails]]) -> None:
+        """Validation errors of a bulk payload, grouped by payload index.
+
+        Errors that do not belong to one payload (for example a malformed request
+        body) are grouped under ``None``.
+        """
+        self.errors = errors
+        invalid = sorted(index for index in errors if index is not None)
+        super().__init__(
+            f"{len(invalid)} invalid payload(s) at indexes {invalid}"
+            if None not in errors
+            else f"Invalid request body: {errors[None][0]['msg']}"
+        )
+
+    def to_jsonable(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "index": index,
+                "errors": [
+                    {
+                        "loc": list(error["loc"]),
+                        "msg": error["msg"],
+                        "type": error["type"],
+                    }
+                    for error in errors
+                ],
+            }
+            for index, errors in self.errors.items()
+        ]
+
+
+class BulkInput(BaseModel, Generic[T]):
+    input_payloads: list[T] = Field(min_length=1)
+    keys: list[str] | None = None
+
+
+def _group_errors(
+    exc: ValidationError, list_loc: tuple[str | int, ...] = ()
+) -> PayloadValidationError:
+    """Group ``exc`` by the payload index that follows ``list_loc`` in each loc."""
+    depth = len(list_loc)
+    errors: dict[int | None, list[ErrorDetails]] = {}
+    for error in exc.errors(include_url=False, include_input=False):
+        loc = error["loc"]
+        index = None
+        if loc[:depth] == list_loc and len(loc) > depth and isinstance(loc[depth], int):
+            index = loc[depth]
+            error["loc"] = loc[depth + 1 :]
+        errors.setdefault(index, []).append(error)
+    return PayloadValidationError(errors)
+
+
+class InputAdapter:
+    def __init__(self, validator: type[Any]) -> None:
+        """Compiled validators for one task input type.
+
+        Pydantic builds the validator of a ``TypeAdapter`` once, so a whole bulk
+        payload is validated in a single ``list[T]`` call instead of a Python loop
+        of ``model_validate`` calls. ``EmptyModel`` tasks ignore their payload, as
+        the Hatchet worker does.
+
+        Args:
+            validator: A Pydantic model, a dataclass, or ``EmptyModel``.
+
+        Raises:
+            TypeError: If ``validator`` is neither a Pydantic model nor a dataclass.
+        """
+        if not isinstance(validator, type) or not (
+            issubclass(validator, BaseModel) or dataclasses.is_dataclass(validator)
+        ):
+            raise TypeError(
+                f"Unsupported input validator type {validator!r}. "
+                "Only Pydantic BaseModel, dataclasses and EmptyModel are supported."
+            )
+
+        self.validator = validator
+        self._ignores_payload = validator is EmptyModel
+        item_type = dict[str, Any] if self._ignores_payload else validator
+        self._one: TypeAdapter[Any] = TypeAdapter(item_type)
+        self._many: TypeAdapter[list[Any]] = TypeAdapter(list[item_type])
+        self._bulk: TypeAdapter[BulkInput[Any]] = TypeAdapter(BulkInput[item_type])
+
+    def _finish(self, value: Any) -> Any:
+        return EmptyModel() if self._ignores_payload else value
+
+    def validate(self, payload: dict[str, Any]) -> Any:
+        """Validate one payload.
+
+        Raises:
+            pydantic.ValidationError: If the payload is invalid.
+        """
+        if self._ignores_payload:
+            return EmptyModel()
+        return self._one.validate_python(payload)
+
+    def validate_many(self, payloads: list[dict[str, Any]]) -> list[Any]:
+        """Validate a list of payloads in one call.
+
+        Raises:
+            PayloadValidationError: With the errors of every invalid payload.
+        """
+        try:
+            values = self._many.validate_python(payloads)
+        except ValidationError as exc:
+            raise _group_errors(exc) from exc
+        return [self._finish(value) for value in values]
+
+    def validate_bulk_json(
+        self, data: str | bytes
+    ) -> tuple[list[Any], list[str] | None]:
+        """Validate a raw ``{"input_payloads": [...], "keys": [...]}`` JSON body.
+
+        The body is parsed and validated in one pass, without building
+        intermediate dicts.
+
+        Returns:
+            The validated inputs and the optional keys.
+
+        Raises:
+            PayloadValidationError: With the errors of every invalid payload.
+        """
+        try:
+            bulk = self._bulk.validate_json(data)
+        except ValidationError as exc:
+            raise _group_errors(exc, list_loc=("input_payloads",)) from exc
+        return [self._finish(value) for value in bulk.input_payloads], bulk.keys
+
+
+@cache
+def input_adapter(validator: type[Any]) -> InputAdapter:
+    """Return the compiled ``InputAdapter`` for ``validator``, building it once."""
+    return InputAdapter(validator)
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from .runner import TaskRunnerCache
+
+
+@dataclass
+class _PendingBatch:
+    items: list[Any] = field(default_factory=list)
+    futures: list[asyncio.Future[Any]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass
+class BatcherStats:
+    submitted_runs: int = 0
+    bulk_calls: int = 0
+
+    @property
+    def batch_factor(self) -> float:
+        if self.bulk_calls == 0:
+            return 0.0
+        return self.submitted_runs / self.bulk_calls
+
+
+class TriggerBatcher:
+    def __init__(
+        self,
+        runners: TaskRunnerCache,
+        max_batch_size: int = 100,
+        max_wait_seconds: float = 0.01,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        """Coalesce concurrent single-run triggers into bulk calls per task name.
+
+        The first submit for a task opens a batch; it is flushed as one
+        ``aio_run_many_no_wait`` call after ``max_wait_seconds`` or as soon as it
+        holds ``max_batch_size`` runs, whichever comes first.
+
+        Args:
+            runners: Per-task runner cache providing schemas and stubs.
+            max_batch_size: Maximum runs submitted in one bulk call.
+            max_wait_seconds: Maximum time a run waits for its batch to fill.
+            logger: Optional logger instance. Defaults to module logger.
+
+        Raises:
+            ValueError: If batch size or wait window is invalid.
+        """
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size must be > 0")
+        if max_wait_seconds < 0:
+            raise ValueError("max_wait_seconds must be >= 0")
+
+        self.runners = runners
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.stats = BatcherStats()
+        self._logger = logger or logging.getLogger(__name__)
+        self._batches: dict[str, _PendingBatch] = {}
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(
+        self, task_name: str, input_payload: dict[str, Any], key: str | None = None
+    ) -> Any:
+        """Queue one run for the next bulk call and return its run reference.
+
+        Input validation happens here, so an invalid payload fails only its own
+        caller instead of the whole batch.
+        """
+        item = self.runners.get(task_name).create_bulk_item(input_payload, key=key)
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+
+        batch = self._batches.get(task_name)
+        if batch is None:
+            batch = _PendingBatch()
+            self._batches[task_name] = batch
+            batch.timer = asyncio.get_running_loop().call_later(
+                self.max_wait_seconds, self._start_flush, task_name
+            )
+
+        batch.items.append(item)
+        batch.futures.append(future)
+        self.stats.submitted_runs += 1
+
+        if len(batch.items) >= self.max_batch_size:
+            self._start_flush(task_name)
+
+        return await future
+
+    async def aclose(self) -> None:
+        """Flush all open batches and wait for in-flight bulk calls."""
+        for task_name in list(self._batches):
+            self._start_flush(task_name)
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    def _start_flush(self, task_name: str) -> None:
+        batch = self._batches.pop(task_name, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = asyncio.get_running_loop().create_task(self._flush(task_name, batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, task_name: str, batch: _PendingBatch) -> None:
+        self.stats.bulk_calls += 1
+        try:
+            run_refs = await self.runners.get(task_name).trigger_bulk_items(batch.items)
+            if len(run_refs) != len(batch.items):
+                raise RuntimeError(
+                    f"Bulk trigger returned {len(run_refs)} run references "
+                    f"for {len(batch.items)} runs"
+                )
+        except Exception as exc:
+            self._logger.exception(
+                "Bulk trigger failed for task_name=%s batch_size=%d",
+                task_name,
+                len(batch.items),
+            )
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        self._logger.debug(
+            "Bulk triggered task_name=%s batch_size=%d", task_name, len(run_refs)
+        )
+        for future, run_ref in zip(batch.futures, run_refs, strict=True):
+            if not future.done():
+                future.set_result(run_ref)
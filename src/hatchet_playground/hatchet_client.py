@@ -1,12 +1,33 @@
+from functools import cache
+from typing import Any
+
 from hatchet_sdk import Hatchet
 from hatchet_sdk.opentelemetry.instrumentor import HatchetInstrumentor
 from langfuse import Langfuse
 from opentelemetry.trace import get_tracer_provider
 
-## Note: Langfuse sets the global tracer provider
-lf = Langfuse()
 
-HatchetInstrumentor(tracer_provider=get_tracer_provider()).instrument()
+@cache
+def init_telemetry() -> Langfuse:
+    """Initialize Langfuse and Hatchet OTel instrumentation once per process."""
+    ## Note: Langfuse sets the global tracer provider
+    lf = Langfuse()
+
+    HatchetInstrumentor(tracer_provider=get_tracer_provider()).instrument()
+    return lf
+
+
+@cache
+def get_hatchet() -> Hatchet:
+    """Return the shared Hatchet client, initializing telemetry first."""
+    init_telemetry()
+    return Hatchet(debug=False)
+
 
-# Initialize Hatchet client
-hatchet = Hatchet(debug=False)
+def __getattr__(name: str) -> Any:
+    # Deferred so importing this module does not initialize clients or telemetry.
+    if name == "hatchet":
+        return get_hatchet()
+    if name == "lf":
+        return init_telemetry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,116 @@
+import importlib
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from hatchet_schemas import (
+    ChatOtelInput,
+    ChatOtelOutput,
+    CpuHeavyTaskInput,
+    ExternallyTriggeredTaskInput,
+    ExternallyTriggeredTaskOutput,
+    SayHelloInput,
+    SayHelloOutput,
+)
+from hatchet_sdk import EmptyModel
+
+
+@dataclass(frozen=True)
+class WorkflowSpec:
+    task_name: str
+    module: str
+    attribute: str
+    input_validator: type[Any] = EmptyModel
+    output_validator: type[Any] | None = None
+
+
+@dataclass(frozen=True)
+class LoadedWorkflow:
+    spec: WorkflowSpec
+    workflow: Any
+    import_seconds: float
+
+
+# NOTE: Only shared schemas live here; workflow modules are imported on demand so the
+# trigger side (task_schemas, runner, FastAPI) never imports worker code.
+WORKFLOWS: dict[str, WorkflowSpec] = {
+    spec.task_name: spec
+    for spec in (
+        WorkflowSpec(
+            task_name="externally-triggered-task",
+            module="hatchet_playground.workflows.externally_triggered",
+            attribute="externally_triggered_task",
+            input_validator=ExternallyTriggeredTaskInput,
+            output_validator=ExternallyTriggeredTaskOutput,
+        ),
+        WorkflowSpec(
+            task_name="first-workflow",
+            module="hatchet_playground.workflows.first_wf",
+            attribute="my_task",
+        ),
+        WorkflowSpec(
+            task_name="say_hello",
+            module="hatchet_playground.workflows.pydantic_wf",
+            attribute="say_hello",
+            input_validator=SayHelloInput,
+            output_validator=SayHelloOutput,
+        ),
+        WorkflowSpec(
+            task_name="sync-sleep-task",
+            module="hatchet_playground.workflows.cpu_bound_sync_sleep",
+            attribute="sync_sleep_task",
+        ),
+        WorkflowSpec(
+            task_name="cpu-heavy-with-process-pool",
+            module="hatchet_playground.workflows.cpu_bound_process_pool",
+            attribute="cpu_heavy_with_process_pool",
+            input_validator=CpuHeavyTaskInput,
+        ),
+        WorkflowSpec(
+            task_name="chat-otel",
+            module="hatchet_playground.workflows.chat_otel",
+            attribute="langfuse_task",
+            input_validator=ChatOtelInput,
+            output_validator=ChatOtelOutput,
+        ),
+    )
+}
+
+
+def parse_workflow_selection(selection: str) -> list[str]:
+    """Parse a comma-separated list of task names.
+
+    Raises:
+        ValueError: If the selection is empty or names an unknown task.
+    """
+    task_names = [name.strip() for name in selection.split(",") if name.strip()]
+    if not task_names:
+        raise ValueError("At least one workflow must be selected")
+
+    unknown = sorted(set(task_names) - WORKFLOWS.keys())
+    if unknown:
+        raise ValueError(
+            f"Unknown workflows: {', '.join(unknown)}. "
+            f"Available: {', '.join(sorted(WORKFLOWS))}"
+        )
+    return list(dict.fromkeys(task_names))
+
+
+def load_workflow(task_name: str) -> LoadedWorkflow:
+    """Import the module defining ``task_name`` and return its workflow object.
+
+    ``import_seconds`` is the time spent importing the module in this call; it is
+    near zero when an earlier workflow already imported the same module.
+
+    Raises:
+        KeyError: If ``task_name`` is not registered.
+    """
+    spec = WORKFLOWS[task_name]
+    started = time.perf_counter()
+    module = importlib.import_module(spec.module)
+    import_seconds = time.perf_counter() - started
+    return LoadedWorkflow(
+        spec=spec,
+        workflow=getattr(module, spec.attribute),
+        import_seconds=import_seconds,
+    )
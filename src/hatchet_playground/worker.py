@@ -1,18 +1,90 @@
-from hatchet_playground.hatchet_client import hatchet
-from hatchet_playground.workflows.chat_otel import langfuse_task
-from hatchet_playground.workflows.externally_triggered import externally_triggered_task
-from hatchet_playground.workflows.first_wf import my_task
-from hatchet_playground.workflows.pydantic_wf import say_hello
+import argparse
+import logging
+import sys
+import time
 
+from hatchet_playground.execution_lanes import lanes_lifespan, worker_slots
+from hatchet_playground.hatchet_client import get_hatchet
+from hatchet_playground.registry import (
+    WORKFLOWS,
+    load_workflow,
+    parse_workflow_selection,
+)
+
+DEFAULT_WORKFLOWS = "first-workflow,say_hello,externally-triggered-task,chat-otel"
+
+logger = logging.getLogger(__name__)
+
+
+def run_worker(name: str, task_names: list[str]) -> None:
+    """Import only the selected workflows and start a worker hosting them."""
+    started = time.perf_counter()
+    hatchet = get_hatchet()
+    logger.info(
+        "Initialized telemetry and Hatchet client in %.3fs",
+        time.perf_counter() - started,
+    )
+
+    workflows = []
+    for task_name in task_names:
+        loaded = load_workflow(task_name)
+        logger.info(
+            "Loaded workflow=%s module=%s import=%.3fs",
+            task_name,
+            loaded.spec.module,
+            loaded.import_seconds,
+        )
+        workflows.append(loaded.workflow)
 
-def main() -> None:
     worker = hatchet.worker(
-        name="test-worker",
-        slots=100,
-        workflows=[my_task, say_hello, externally_triggered_task, langfuse_task],
+        name=name,
+        slots=worker_slots(workflows),
+        workflows=workflows,
+        lifespan=lanes_lifespan(workflows),
+    )
+    logger.info(
+        "Worker %s ready with %d workflows in %.3fs",
+        name,
+        len(workflows),
+        time.perf_counter() - started,
     )
     worker.start()
 
 
+def parse_args(default_name: str, default_workflows: str) -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--name", default=default_name)
+    parser.add_argument(
+        "--workflows",
+        default=default_workflows,
+        help="Comma-separated task names to host, e.g. 'say_hello,chat-otel'",
+    )
+    parser.add_argument(
+        "--list-workflows",
+        action="store_true",
+        help="List registered task names and exit",
+    )
+    return parser.parse_args()
+
+
+def main(
+    default_name: str = "test-worker", default_workflows: str = DEFAULT_WORKFLOWS
+) -> None:
+    args = parse_args(default_name, default_workflows)
+
+    if args.list_workflows:
+        for task_name in sorted(WORKFLOWS):
+            sys.stdout.write(f"{task_name}\n")
+        raise SystemExit(0)
+
+    try:
+        task_names = parse_workflow_selection(args.workflows)
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+
+    logging.basicConfig(level=logging.INFO)
+    run_worker(args.name, task_names)
+
+
 if __name__ == "__main__":
     main()
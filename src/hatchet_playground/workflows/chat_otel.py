@@ -1,30 +1,68 @@
 import os
+from functools import cache
 
+import httpx
 from hatchet_schemas import ChatOtelInput, ChatOtelOutput
 from hatchet_sdk import Context
 from langfuse.openai import AsyncOpenAI
+from opentelemetry.trace import get_current_span
 
+from hatchet_playground.async_cache import AsyncTTLCache
+from hatchet_playground.execution_lanes import Lane, lane_task
 from hatchet_playground.hatchet_client import hatchet
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", None)
+_RESPONSE_CACHE: AsyncTTLCache[str, str | None] = AsyncTTLCache(
+    maxsize=int(os.getenv("CHAT_OTEL_CACHE_SIZE", "1024")),
+    ttl_seconds=float(os.getenv("CHAT_OTEL_CACHE_TTL_SECONDS", "300")),
+)
 
-if OPENAI_API_KEY is None:
-    raise ValueError("OPENAI_API_KEY environment variable is not set.")
 
+@cache
+def _openai_client() -> AsyncOpenAI:
+    """Shared client so runs reuse keep-alive connections instead of new TLS handshakes.
 
-@hatchet.task(name="chat-otel", input_validator=ChatOtelInput)
-async def langfuse_task(input: ChatOtelInput, ctx: Context) -> ChatOtelOutput:
-    openai = AsyncOpenAI(api_key=OPENAI_API_KEY)
+    Raises:
+        ValueError: If ``OPENAI_API_KEY`` is not set.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if api_key is None:
+        raise ValueError("OPENAI_API_KEY environment variable is not set.")
+
+    return AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60,
+            )
+        ),
+    )
 
+
+async def _complete(input: ChatOtelInput) -> str | None:
     # Usage, cost, etc. of this call will be sent to Langfuse.
-    generation = await openai.chat.completions.create(
+    generation = await _openai_client().chat.completions.create(
         model=input.model,
         messages=[
             {"role": "system", "content": input.system_prompt},
             {"role": "user", "content": input.question},
         ],
     )
+    return generation.choices[0].message.content
+
+
+@lane_task(Lane.ASYNC, hatchet.task(name="chat-otel", input_validator=ChatOtelInput))
+async def langfuse_task(input: ChatOtelInput, ctx: Context) -> ChatOtelOutput:
+    answer, outcome = await _RESPONSE_CACHE.get_or_compute(
+        input.model_dump_json(), lambda: _complete(input)
+    )
+
+    span = get_current_span()
+    span.set_attribute("chat_otel.cache.outcome", outcome.value)
+    span.set_attribute("chat_otel.cache.hits", _RESPONSE_CACHE.stats.hits)
+    span.set_attribute("chat_otel.cache.misses", _RESPONSE_CACHE.stats.misses)
 
-    ctx.log(f"Executed langfuse task with input: {input.question}")
+    ctx.log(f"Executed langfuse task with input: {input.question} (cache {outcome})")
 
-    return ChatOtelOutput(answer=generation.choices[0].message.content)
+    return ChatOtelOutput(answer=answer)
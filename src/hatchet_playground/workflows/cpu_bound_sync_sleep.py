@@ -3,14 +3,18 @@ from datetime import timedelta
 
 from hatchet_sdk import Context, EmptyModel
 
+from hatchet_playground.execution_lanes import Lane, lane_task
 from hatchet_playground.hatchet_client import hatchet
 
 
-@hatchet.task(
-    name="sync-sleep-task",
-    input_validator=EmptyModel,
-    execution_timeout=timedelta(seconds=20),
-    retries=1,
+@lane_task(
+    Lane.BLOCKING,
+    hatchet.task(
+        name="sync-sleep-task",
+        input_validator=EmptyModel,
+        execution_timeout=timedelta(seconds=20),
+        retries=1,
+    ),
 )
 def sync_sleep_task(input: EmptyModel, ctx: Context) -> dict[str, str | int | float]:
     print("Executing sync_sleep_task")
@@ -4,9 +4,14 @@ from hatchet_schemas import (
 )
 from hatchet_sdk import Context, Hatchet
 
+from hatchet_playground.execution_lanes import Lane, lane_task
+
 hatchet = Hatchet()
 
 
-@hatchet.task(name="externally-triggered-task", input_validator=TaskInput)
+@lane_task(
+    Lane.ASYNC,
+    hatchet.task(name="externally-triggered-task", input_validator=TaskInput),
+)
 async def externally_triggered_task(input: TaskInput, ctx: Context) -> TaskOutput:
     return TaskOutput(ok=True)
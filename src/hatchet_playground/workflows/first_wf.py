@@ -1,9 +1,10 @@
 from hatchet_sdk import Context, EmptyModel
 
+from hatchet_playground.execution_lanes import Lane, lane_task
 from hatchet_playground.hatchet_client import hatchet
 
 
-@hatchet.task(name="first-workflow")
+@lane_task(Lane.ASYNC, hatchet.task(name="first-workflow"))
 def my_task(input: EmptyModel, ctx: Context) -> dict[str, int]:
     print("executed task")
 
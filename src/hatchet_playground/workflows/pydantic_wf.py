@@ -1,9 +1,10 @@
 from hatchet_schemas import SayHelloInput, SayHelloOutput
 from hatchet_sdk import Context
 
+from hatchet_playground.execution_lanes import Lane, lane_task
 from hatchet_playground.hatchet_client import hatchet
 
 
-@hatchet.task(input_validator=SayHelloInput)
+@lane_task(Lane.ASYNC, hatchet.task(input_validator=SayHelloInput))
 def say_hello(input: SayHelloInput, ctx: Context) -> SayHelloOutput:
     return SayHelloOutput(message=f"Hello, {input.name}!")
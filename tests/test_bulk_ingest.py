@@ -0,0 +1,140 @@
+import io
+import json
+import unittest
+from datetime import datetime
+from typing import Any
+
+from hatchet_playground.external.bulk_ingest import (
+    BulkIngestor,
+    IngestSettings,
+    idempotency_key,
+)
+
+TASK_NAME = "externally-triggered-task"
+
+
+class RunRef:
+    def __init__(self, workflow_run_id: str) -> None:
+        self.workflow_run_id = workflow_run_id
+
+
+class FakeRunner:
+    """Bulk trigger client that, like Hatchet, creates a run per call and line."""
+
+    task_name = TASK_NAME
+
+    def __init__(self) -> None:
+        self.runs: list[tuple[str, dict[str, str]]] = []
+        self.calls = 0
+        self.failures_left = 0
+        self.timeouts_left = 0
+
+    def validate_many(self, input_payloads: list[dict[str, Any]]) -> list[Any]:
+        return input_payloads
+
+    async def trigger_validated_many(
+        self,
+        inputs: list[Any],
+        keys: list[str] | None = None,
+        additional_metadata: dict[str, str] | None = None,
+    ) -> list[Any]:
+        self.calls += 1
+        if self.failures_left > 0:
+            self.failures_left -= 1
+            raise ConnectionError("unavailable")
+        assert keys is not None
+        run_ids = []
+        for key in keys:
+            run_ids.append(f"run-{len(self.runs)}")
+            self.runs.append((key, {**(additional_metadata or {}), "key": key}))
+        if self.timeouts_left > 0:
+            # The runs were created, but the response never arrived.
+            self.timeouts_left -= 1
+            raise TimeoutError("deadline exceeded")
+        return [RunRef(run_id) for run_id in run_ids]
+
+    async def find_keyed_runs(
+        self, additional_metadata: dict[str, str], since: datetime
+    ) -> dict[str, str]:
+        return {
+            key: f"run-{index}"
+            for index, (key, metadata) in enumerate(self.runs)
+            if additional_metadata.items() <= metadata.items()
+        }
+
+
+def _ndjson(payloads: list[dict[str, Any]]) -> list[str]:
+    return [json.dumps(payload) + "\n" for payload in payloads]
+
+
+def _records(output: io.StringIO) -> list[dict[str, Any]]:
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    return sorted(records, key=lambda record: record["line"])
+
+
+class BulkIngestorTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.runner = FakeRunner()
+        self.settings = IngestSettings(chunk_size=2, base_backoff_seconds=0.001)
+
+    async def ingest(self, lines: list[str]) -> tuple[BulkIngestor, io.StringIO]:
+        ingestor = BulkIngestor(self.runner, self.settings)
+        output = io.StringIO()
+        await ingestor.ingest(lines, output)
+        return ingestor, output
+
+    async def test_every_line_gets_a_record(self) -> None:
+        lines = _ndjson([{"user_id": 1}, {"user_id": 1}, {"user_id": 2}])
+        ingestor, output = await self.ingest([*lines, "not json\n"])
+
+        records = _records(output)
+        self.assertEqual([record["line"] for record in records], [1, 2, 3, 4])
+        self.assertIn("workflow_run_id", records[0])
+        self.assertEqual(records[1]["duplicate_of"], 1)
+        self.assertIn("workflow_run_id", records[2])
+        self.assertIn("error", records[3])
+        self.assertEqual(ingestor.stats.submitted_runs, 2)
+
+    async def test_retry_after_timeout_does_not_duplicate_runs(self) -> None:
+        self.runner.timeouts_left = 1
+        payloads = [{"user_id": index} for index in range(1, 5)]
+
+        ingestor, output = await self.ingest(_ndjson(payloads))
+
+        keys = [idempotency_key(TASK_NAME, payload) for payload in payloads]
+        self.assertEqual(sorted(key for key, _ in self.runner.runs), sorted(keys))
+        self.assertEqual(ingestor.stats.retries, 1)
+        self.assertEqual(ingestor.stats.recovered_runs, 2)
+        self.assertEqual(ingestor.stats.submitted_runs, 2)
+        records = _records(output)
+        self.assertEqual([record["key"] for record in records], keys)
+        self.assertEqual(
+            len({record["workflow_run_id"] for record in records}), len(payloads)
+        )
+
+    async def test_transient_failures_are_retried(self) -> None:
+        self.runner.failures_left = 2
+
+        ingestor, output = await self.ingest(_ndjson([{"user_id": 1}]))
+
+        self.assertEqual(ingestor.stats.retries, 2)
+        self.assertEqual(ingestor.stats.submitted_runs, 1)
+        self.assertIn("workflow_run_id", _records(output)[0])
+
+    async def test_chunk_fails_after_max_attempts(self) -> None:
+        self.runner.failures_left = self.settings.max_attempts
+
+        ingestor, output = await self.ingest(_ndjson([{"user_id": 1}]))
+
+        self.assertEqual(ingestor.stats.failed_runs, 1)
+        self.assertEqual(_records(output)[0]["error"], "unavailable")
+
+    def test_settings_are_validated(self) -> None:
+        with self.assertRaises(ValueError):
+            IngestSettings(chunk_size=0)
+        with self.assertRaises(ValueError):
+            IngestSettings(base_backoff_seconds=2.0, max_backoff_seconds=1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
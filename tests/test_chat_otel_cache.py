@@ -0,0 +1,186 @@
+import asyncio
+import base64
+import json
+import os
+import unittest
+from unittest import mock
+
+import httpx
+import openai
+
+
+def _fake_hatchet_token() -> str:
+    claims = {
+        "sub": "00000000-0000-0000-0000-000000000000",
+        "server_url": "http://localhost",
+        "grpc_broadcast_address": "localhost:7070",
+    }
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).decode()
+    return f"eyJhbGciOiJub25lIn0.{payload.rstrip('=')}.signature"
+
+
+# chat_otel needs a Hatchet token at import; it is never used.
+os.environ.setdefault("HATCHET_CLIENT_TOKEN", _fake_hatchet_token())
+
+from hatchet_schemas import ChatOtelInput, ChatOtelOutput  # noqa: E402
+
+from hatchet_playground.async_cache import AsyncTTLCache, CacheOutcome  # noqa: E402
+from hatchet_playground.workflows import chat_otel  # noqa: E402
+
+
+class FakeChatCompletions:
+    """Local stand-in for ``POST /v1/chat/completions`` served via httpx."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.delay_seconds = 0.0
+        self.failures_left = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/chat/completions"
+        self.calls += 1
+        body = json.loads(request.content)
+        await asyncio.sleep(self.delay_seconds)
+
+        if self.failures_left > 0:
+            self.failures_left -= 1
+            return httpx.Response(500, json={"error": {"message": "upstream down"}})
+
+        question = body["messages"][-1]["content"]
+        return httpx.Response(
+            200,
+            json={
+                "id": f"chatcmpl-{self.calls}",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {
+                            "role": "assistant",
+                            "content": f"answer {self.calls}: {question}",
+                        },
+                    }
+                ],
+            },
+        )
+
+    def client(self) -> chat_otel.AsyncOpenAI:
+        return chat_otel.AsyncOpenAI(
+            api_key="sk-test",
+            base_url="http://fake-openai/v1",
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self)),
+        )
+
+
+class ChatOtelCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.endpoint = FakeChatCompletions()
+        client = self.endpoint.client()
+        patcher = mock.patch.object(chat_otel, "_openai_client", lambda: client)
+        patcher.start()
+        self.addAsyncCleanup(client.close)
+        self.addCleanup(patcher.stop)
+
+    async def ask(
+        self, cache: AsyncTTLCache[str, str | None], question: str
+    ) -> tuple[str | None, CacheOutcome]:
+        input = ChatOtelInput(question=question)
+        return await cache.get_or_compute(
+            input.model_dump_json(), lambda: chat_otel._complete(input)
+        )
+
+    async def test_miss_then_hit(self) -> None:
+        cache: AsyncTTLCache[str, str | None] = AsyncTTLCache()
+
+        first = await self.ask(cache, "q")
+        second = await self.ask(cache, "q")
+
+        self.assertEqual(first, ("answer 1: q", CacheOutcome.MISS))
+        self.assertEqual(second, ("answer 1: q", CacheOutcome.HIT))
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+        self.assertEqual(self.endpoint.calls, 1)
+
+    async def test_entries_expire_after_ttl(self) -> None:
+        cache: AsyncTTLCache[str, str | None] = AsyncTTLCache(ttl_seconds=0.05)
+
+        await self.ask(cache, "q")
+        await asyncio.sleep(0.1)
+        answer, outcome = await self.ask(cache, "q")
+
+        self.assertEqual((answer, outcome), ("answer 2: q", CacheOutcome.MISS))
+        self.assertEqual(self.endpoint.calls, 2)
+
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache: AsyncTTLCache[str, str | None] = AsyncTTLCache(maxsize=2)
+
+        await self.ask(cache, "a")
+        await self.ask(cache, "b")
+        await self.ask(cache, "a")  # "b" is now least recently used.
+        await self.ask(cache, "c")
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual((await self.ask(cache, "a"))[1], CacheOutcome.HIT)
+        self.assertEqual((await self.ask(cache, "b"))[1], CacheOutcome.MISS)
+        self.assertEqual(self.endpoint.calls, 4)
+
+    async def test_concurrent_identical_requests_share_one_call(self) -> None:
+        cache: AsyncTTLCache[str, str | None] = AsyncTTLCache()
+        self.endpoint.delay_seconds = 0.05
+
+        results = await asyncio.gather(*(self.ask(cache, "q") for _ in range(10)))
+
+        self.assertEqual(self.endpoint.calls, 1)
+        self.assertEqual({answer for answer, _ in results}, {"answer 1: q"})
+        outcomes = [outcome for _, outcome in results]
+        self.assertEqual(outcomes.count(CacheOutcome.MISS), 1)
+        self.assertEqual(outcomes.count(CacheOutcome.IN_FLIGHT), 9)
+
+    async def test_failures_are_not_cached(self) -> None:
+        cache: AsyncTTLCache[str, str | None] = AsyncTTLCache()
+        self.endpoint.delay_seconds = 0.05
+        self.endpoint.failures_left = 1
+
+        results = await asyncio.gather(
+            self.ask(cache, "q"), self.ask(cache, "q"), return_exceptions=True
+        )
+        self.assertTrue(
+            all(isinstance(result, openai.InternalServerError) for result in results)
+        )
+        self.assertEqual(len(cache), 0)
+
+        answer, outcome = await self.ask(cache, "q")
+
+        self.assertEqual((answer, outcome), ("answer 2: q", CacheOutcome.MISS))
+        self.assertEqual(self.endpoint.calls, 2)
+
+    async def test_task_answers_repeated_questions_from_cache(self) -> None:
+        cache: AsyncTTLCache[str, str | None] = AsyncTTLCache()
+        input = ChatOtelInput(question="task")
+
+        with mock.patch.object(chat_otel, "_RESPONSE_CACHE", cache):
+            first = await chat_otel.langfuse_task.aio_mock_run(input=input)
+            second = await chat_otel.langfuse_task.aio_mock_run(input=input)
+
+        self.assertEqual(first, ChatOtelOutput(answer="answer 1: task"))
+        self.assertEqual(second, first)
+        self.assertEqual(self.endpoint.calls, 1)
+
+
+class OpenAIClientTest(unittest.TestCase):
+    def test_missing_api_key_fails_on_first_use_not_at_import(self) -> None:
+        with mock.patch.dict(os.environ):
+            os.environ.pop("OPENAI_API_KEY", None)
+            chat_otel._openai_client.cache_clear()
+            self.addCleanup(chat_otel._openai_client.cache_clear)
+
+            with self.assertRaisesRegex(ValueError, "OPENAI_API_KEY"):
+                chat_otel._openai_client()
+
+
+if __name__ == "__main__":
+    unittest.main()
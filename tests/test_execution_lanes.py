@@ -0,0 +1,120 @@
+import asyncio
+import inspect
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any
+
+from hatchet_playground.execution_lanes import (
+    TASK_LANES,
+    ExecutionLanes,
+    Lane,
+    LaneCapacity,
+    lane_task,
+)
+
+
+class Peak:
+    """Tracks the highest number of callers inside ``run`` at once."""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def enter(self) -> None:
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+
+    def exit(self) -> None:
+        with self._lock:
+            self.current -= 1
+
+
+def fake_task_decorator(name: str) -> Any:
+    def decorator(fn: Any) -> SimpleNamespace:
+        return SimpleNamespace(name=name, fn=fn)
+
+    return decorator
+
+
+class ExecutionLanesTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.lanes = ExecutionLanes(
+            LaneCapacity(async_slots=100, blocking_threads=2, cpu_processes=3)
+        )
+
+    def test_worker_slots_are_the_sum_of_hosted_lanes(self) -> None:
+        self.assertEqual(self.lanes.slots_for([Lane.ASYNC]), 100)
+        self.assertEqual(self.lanes.slots_for([Lane.BLOCKING, Lane.CPU]), 5)
+        self.assertEqual(
+            self.lanes.slots_for([Lane.ASYNC, Lane.BLOCKING, Lane.BLOCKING]), 102
+        )
+
+    def test_blocking_lane_runs_at_most_its_capacity(self) -> None:
+        peak = Peak()
+        ctx = SimpleNamespace(exit_flag=False)
+
+        def run() -> None:
+            with self.lanes.blocking_slot(ctx):
+                peak.enter()
+                time.sleep(0.02)
+                peak.exit()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(run) for _ in range(8)]:
+                future.result()
+
+        self.assertEqual(peak.peak, 2)
+
+    def test_cancelled_run_stops_waiting_for_the_blocking_lane(self) -> None:
+        running = SimpleNamespace(exit_flag=False)
+        cancelled = SimpleNamespace(exit_flag=True)
+
+        with self.lanes.blocking_slot(running), self.lanes.blocking_slot(running):
+            with self.assertRaises(RuntimeError):
+                with self.lanes.blocking_slot(cancelled):
+                    pass
+
+    async def test_cpu_lane_runs_at_most_its_capacity(self) -> None:
+        peak = Peak()
+
+        async def run() -> None:
+            async with self.lanes.cpu_slot():
+                peak.enter()
+                await asyncio.sleep(0.01)
+                peak.exit()
+
+        await asyncio.gather(*(run() for _ in range(10)))
+
+        self.assertEqual(peak.peak, 3)
+
+    def test_lane_task_keeps_the_task_signature(self) -> None:
+        @lane_task(Lane.BLOCKING, fake_task_decorator("lanes-blocking-test"))
+        def task(input: dict[str, int], ctx: Any) -> dict[str, int]:
+            return input
+
+        ctx = SimpleNamespace(exit_flag=False)
+
+        self.assertEqual(TASK_LANES["lanes-blocking-test"], Lane.BLOCKING)
+        self.assertEqual(task.fn({"a": 1}, ctx), {"a": 1})
+        self.assertEqual(task.fn.__name__, "task")
+        self.assertEqual(list(inspect.signature(task.fn).parameters), ["input", "ctx"])
+        self.assertFalse(inspect.iscoroutinefunction(task.fn))
+
+    def test_lane_task_rejects_functions_of_the_wrong_kind(self) -> None:
+        async def async_fn(input: Any, ctx: Any) -> None: ...
+
+        def sync_fn(input: Any, ctx: Any) -> None: ...
+
+        with self.assertRaises(TypeError):
+            lane_task(Lane.BLOCKING, fake_task_decorator("x"))(async_fn)
+        with self.assertRaises(TypeError):
+            lane_task(Lane.CPU, fake_task_decorator("y"))(sync_fn)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import io
+import json
+import unittest
+from typing import Any
+
+from hatchet_schemas import ExternallyTriggeredTaskOutput, SayHelloInput, SayHelloOutput
+from hatchet_sdk import EmptyModel
+
+from hatchet_playground.benchmarks.fake_hatchet import FakeHatchet
+from hatchet_playground.external.bulk_ingest import BulkIngestor, IngestSettings
+from hatchet_playground.external.runner import RUN_KEY_METADATA, TaskRunnerCache
+
+TASK_NAME = "externally-triggered-task"
+
+
+class FakeHatchetTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.hatchet = FakeHatchet(slots=100, run_duration_seconds=0.0)
+        self.runners = TaskRunnerCache(hatchet=self.hatchet)
+
+    async def test_run_keys_are_not_deduplicated(self) -> None:
+        runner = self.runners.get(TASK_NAME)
+
+        first = await runner.trigger_many_no_wait([{"user_id": 1}], keys=["a"])
+        second = await runner.trigger_many_no_wait([{"user_id": 1}], keys=["a"])
+
+        self.assertNotEqual(first[0].workflow_run_id, second[0].workflow_run_id)
+        listed = await self.hatchet.runs.aio_list(
+            additional_metadata={RUN_KEY_METADATA: "a"}
+        )
+        self.assertEqual(len(listed.rows), 2)
+
+    async def test_results_are_validated_into_the_output_type(self) -> None:
+        runner = self.runners.get(TASK_NAME)
+        say_hello = self.hatchet.stubs.task(
+            "say_hello", input_validator=SayHelloInput, output_validator=SayHelloOutput
+        )
+        untyped = self.hatchet.stubs.task("first-workflow")
+
+        (run_ref,) = await runner.trigger_many_no_wait([{"user_id": 1}])
+        hello_ref = await say_hello.aio_run_no_wait(SayHelloInput(name="fake"))
+        untyped_ref = await untyped.aio_run_no_wait()
+
+        self.assertEqual(
+            await run_ref.aio_result(), ExternallyTriggeredTaskOutput(ok=True)
+        )
+        self.assertEqual(
+            await hello_ref.aio_result(), SayHelloOutput(message="Hello, fake!")
+        )
+        self.assertIsInstance(await untyped_ref.aio_result(), EmptyModel)
+        raw = await self.hatchet.runs.get_run_ref(run_ref.workflow_run_id).aio_result()
+        self.assertEqual(raw, {TASK_NAME: {"ok": True}})
+
+    async def test_bulk_ingest_retry_after_timeout_creates_each_run_once(
+        self,
+    ) -> None:
+        runner = self.runners.get(TASK_NAME)
+        trigger = runner.trigger_validated_many
+        timeouts_left = 1
+
+        async def trigger_then_time_out(*args: Any, **kwargs: Any) -> list[Any]:
+            nonlocal timeouts_left
+            run_refs = await trigger(*args, **kwargs)
+            if timeouts_left:
+                timeouts_left -= 1
+                raise TimeoutError("deadline exceeded")
+            return run_refs
+
+        runner.trigger_validated_many = trigger_then_time_out  # type: ignore[method-assign]
+        lines = [json.dumps({"user_id": index}) + "\n" for index in range(5)]
+        settings = IngestSettings(chunk_size=5, base_backoff_seconds=0.001)
+
+        ingestor = BulkIngestor(runner, settings)
+        await ingestor.ingest(lines, io.StringIO())
+
+        listed = await self.hatchet.runs.aio_list(limit=100)
+        self.assertEqual(len(listed.rows), 5)
+        self.assertEqual(ingestor.stats.recovered_runs, 5)
+        self.assertEqual(ingestor.stats.retries, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import asyncio
+import unittest
+
+from hatchet_sdk.clients.rest.models.v1_task_status import V1TaskStatus
+
+from hatchet_playground.benchmarks.fake_hatchet import FakeHatchet
+from hatchet_playground.external.runner import TaskRunnerCache
+from hatchet_playground.external.status_watcher import RunStatusWatcher, WatcherSettings
+
+TASK_NAME = "externally-triggered-task"
+
+
+class RunStatusWatcherTest(unittest.IsolatedAsyncioTestCase):
+    def start(
+        self, run_duration_seconds: float, **settings: float
+    ) -> tuple[FakeHatchet, RunStatusWatcher]:
+        hatchet = FakeHatchet(
+            slots=1_000,
+            api_latency_seconds=0.001,
+            run_duration_seconds=run_duration_seconds,
+        )
+        watcher = RunStatusWatcher(
+            hatchet.runs, WatcherSettings(min_interval_seconds=0.02, **settings)
+        )
+        self.addAsyncCleanup(watcher.aclose)
+        return hatchet, watcher
+
+    async def trigger(self, hatchet: FakeHatchet, runs: int) -> list[str]:
+        runner = TaskRunnerCache(hatchet=hatchet).get(TASK_NAME)
+        run_refs = await runner.trigger_many_no_wait(
+            [{"user_id": index} for index in range(runs)]
+        )
+        return [ref.workflow_run_id for ref in run_refs]
+
+    async def test_long_runs_are_resolved_in_batches(self) -> None:
+        hatchet, watcher = self.start(run_duration_seconds=1.0)
+        run_ids = await self.trigger(hatchet, 200)
+
+        watched = await asyncio.gather(*(watcher.watch(run_id) for run_id in run_ids))
+
+        self.assertEqual({w.status for w in watched}, {V1TaskStatus.COMPLETED})
+        self.assertEqual(watcher.stats.status_calls, 0)
+        self.assertGreater(watcher.stats.list_calls, 3)
+        self.assertLess(watcher.stats.api_calls_per_run, 0.5)
+
+    async def test_untagged_runs_fall_back_to_status_calls(self) -> None:
+        hatchet, watcher = self.start(run_duration_seconds=0.1, fallback_after_rounds=2)
+        # Triggered without the watcher's metadata tag, so never listed.
+        run_ref = await hatchet.stubs.task(TASK_NAME).aio_run_no_wait({"user_id": 1})
+
+        watched = await asyncio.wait_for(
+            watcher.watch(run_ref.workflow_run_id), timeout=5.0
+        )
+
+        self.assertEqual(watched.status, V1TaskStatus.COMPLETED)
+        self.assertGreaterEqual(watcher.stats.status_calls, 1)
+        self.assertEqual(
+            hatchet.runs.api_calls["aio_get_status"], watcher.stats.status_calls
+        )
+
+    async def test_timeout_of_one_waiter_does_not_cancel_the_other(self) -> None:
+        hatchet, watcher = self.start(run_duration_seconds=0.3)
+        (run_id,) = await self.trigger(hatchet, 1)
+
+        impatient, patient = await asyncio.gather(
+            watcher.watch(run_id, timeout_seconds=0.05),
+            watcher.watch(run_id, timeout_seconds=5.0),
+            return_exceptions=True,
+        )
+
+        self.assertIsInstance(impatient, TimeoutError)
+        self.assertEqual(patient.status, V1TaskStatus.COMPLETED)
+        self.assertEqual(watcher.pending_count, 0)
+
+    async def test_run_is_dropped_when_every_waiter_times_out(self) -> None:
+        hatchet, watcher = self.start(run_duration_seconds=10.0)
+        (run_id,) = await self.trigger(hatchet, 1)
+
+        results = await asyncio.gather(
+            watcher.watch(run_id, timeout_seconds=0.05),
+            watcher.watch(run_id, timeout_seconds=0.1),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(all(isinstance(r, TimeoutError) for r in results))
+        self.assertEqual(watcher.pending_count, 0)
+
+    async def test_api_calls_are_shared_across_resolved_runs(self) -> None:
+        hatchet, watcher = self.start(run_duration_seconds=0.2)
+        run_ids = await self.trigger(hatchet, 50)
+
+        watched = await asyncio.gather(*(watcher.watch(run_id) for run_id in run_ids))
+
+        stats = watcher.stats
+        self.assertEqual(stats.completed_runs, 50)
+        self.assertEqual(stats.list_calls, hatchet.runs.api_calls["aio_list"])
+        self.assertAlmostEqual(
+            sum(w.api_calls for w in watched), stats.list_calls + stats.status_calls
+        )
+        self.assertAlmostEqual(
+            stats.api_calls_per_run, stats.resolved_api_calls / stats.completed_runs
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import json
+import unittest
+
+from hatchet_schemas import ExternallyTriggeredTaskInput, SayHelloInput
+from hatchet_sdk import EmptyModel
+from pydantic import ValidationError
+
+from hatchet_playground.external.task_schemas import (
+    InputAdapter,
+    PayloadValidationError,
+    input_adapter,
+)
+
+
+class InputAdapterTest(unittest.TestCase):
+    def test_dataclass_inputs_are_validated_into_the_dataclass(self) -> None:
+        adapter = input_adapter(SayHelloInput)
+
+        self.assertEqual(adapter.validate({"name": "a"}), SayHelloInput(name="a"))
+        self.assertEqual(
+            adapter.validate_many([{"name": "a"}, {"name": "b"}]),
+            [SayHelloInput(name="a"), SayHelloInput(name="b")],
+        )
+        with self.assertRaises(ValidationError):
+            adapter.validate({})
+
+    def test_empty_model_ignores_the_payload(self) -> None:
+        adapter = input_adapter(EmptyModel)
+
+        self.assertIsInstance(adapter.validate({"anything": 1}), EmptyModel)
+        inputs, keys = adapter.validate_bulk_json(b'{"input_payloads": [{}, {"x": 1}]}')
+        self.assertEqual(len(inputs), 2)
+        self.assertTrue(all(isinstance(value, EmptyModel) for value in inputs))
+        self.assertIsNone(keys)
+
+    def test_adapters_are_built_once_per_validator(self) -> None:
+        self.assertIs(input_adapter(SayHelloInput), input_adapter(SayHelloInput))
+
+    def test_unsupported_validators_are_rejected(self) -> None:
+        with self.assertRaises(TypeError):
+            InputAdapter(dict)
+
+    def test_validate_many_groups_errors_by_payload_index(self) -> None:
+        adapter = input_adapter(ExternallyTriggeredTaskInput)
+        payloads = [{"user_id": 1}, {"user_id": "x"}, {"user_id": 3}, {}]
+
+        with self.assertRaises(PayloadValidationError) as raised:
+            adapter.validate_many(payloads)
+
+        errors = raised.exception.to_jsonable()
+        self.assertEqual([entry["index"] for entry in errors], [1, 3])
+        self.assertEqual(errors[0]["errors"][0]["loc"], ["user_id"])
+        self.assertEqual(errors[0]["errors"][0]["type"], "int_parsing")
+        self.assertEqual(errors[1]["errors"][0]["type"], "missing")
+        self.assertIn("[1, 3]", str(raised.exception))
+
+    def test_validate_bulk_json_returns_inputs_and_keys(self) -> None:
+        adapter = input_adapter(ExternallyTriggeredTaskInput)
+        body = json.dumps({"input_payloads": [{"user_id": 1}], "keys": ["a"]})
+
+        inputs, keys = adapter.validate_bulk_json(body)
+
+        self.assertEqual(inputs, [ExternallyTriggeredTaskInput(user_id=1)])
+        self.assertEqual(keys, ["a"])
+
+    def test_validate_bulk_json_indexes_payload_errors(self) -> None:
+        adapter = input_adapter(ExternallyTriggeredTaskInput)
+        body = json.dumps({"input_payloads": [{"user_id": 1}, {"user_id": "x"}]})
+
+        with self.assertRaises(PayloadValidationError) as raised:
+            adapter.validate_bulk_json(body)
+
+        self.assertEqual(list(raised.exception.errors), [1])
+
+    def test_malformed_bodies_are_not_tied_to_a_payload(self) -> None:
+        adapter = input_adapter(ExternallyTriggeredTaskInput)
+        bodies = [
+            b"not json",
+            b'{"keys": ["a"]}',
+            b'{"input_payloads": []}',
+            b'{"input_payloads": {"user_id": 1}}',
+        ]
+
+        for body in bodies:
+            with self.subTest(body=body):
+                with self.assertRaises(PayloadValidationError) as raised:
+                    adapter.validate_bulk_json(body)
+
+                self.assertIn(None, raised.exception.errors)
+                self.assertEqual(raised.exception.to_jsonable()[0]["index"], None)
+                self.assertTrue(str(raised.exception).startswith("Invalid request"))
+
+
+if __name__ == "__main__":
+    unittest.main()
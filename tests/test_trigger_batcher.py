@@ -0,0 +1,101 @@
+import asyncio
+import math
+import unittest
+
+from hatchet_playground.benchmarks.fake_hatchet import FakeHatchet
+from hatchet_playground.external.runner import TaskRunnerCache
+from hatchet_playground.external.trigger_batcher import TriggerBatcher
+
+TASK_NAME = "externally-triggered-task"
+
+
+class TriggerBatcherTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.hatchet = FakeHatchet(slots=10_000, run_duration_seconds=0.0)
+        self.runners = TaskRunnerCache(hatchet=self.hatchet)
+
+    async def test_concurrent_submits_share_bulk_calls(self) -> None:
+        runs, batch_size = 1_000, 50
+        batcher = TriggerBatcher(
+            self.runners, max_batch_size=batch_size, max_wait_seconds=0.05
+        )
+
+        run_refs = await asyncio.gather(
+            *(batcher.submit(TASK_NAME, {"user_id": index}) for index in range(runs))
+        )
+        await batcher.aclose()
+
+        bulk_calls = self.hatchet.runs.api_calls["aio_run_many_no_wait"]
+        self.assertEqual(bulk_calls, batcher.stats.bulk_calls)
+        self.assertLessEqual(bulk_calls, math.ceil(runs / batch_size) + 1)
+        self.assertGreaterEqual(batcher.stats.batch_factor, batch_size * 0.9)
+
+        run_ids = [ref.workflow_run_id for ref in run_refs]
+        self.assertEqual(len(set(run_ids)), runs)
+        for index, run_id in enumerate(run_ids):
+            self.assertEqual(self.hatchet.runs.get_run(run_id).input, {"user_id": index})
+
+    async def test_flush_window_bounds_latency_of_small_batches(self) -> None:
+        batcher = TriggerBatcher(self.runners, max_batch_size=100, max_wait_seconds=0.01)
+
+        run_ref = await asyncio.wait_for(
+            batcher.submit(TASK_NAME, {"user_id": 1}), timeout=1.0
+        )
+
+        self.assertTrue(run_ref.workflow_run_id)
+        self.assertEqual(batcher.stats.bulk_calls, 1)
+
+    async def test_invalid_payload_fails_only_its_caller(self) -> None:
+        batcher = TriggerBatcher(self.runners, max_batch_size=10, max_wait_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit(TASK_NAME, {"user_id": 1}),
+            batcher.submit(TASK_NAME, {"user_id": "not-an-int"}),
+            return_exceptions=True,
+        )
+
+        self.assertTrue(results[0].workflow_run_id)
+        self.assertIsInstance(results[1], ValueError)
+
+    async def test_bulk_failure_fails_every_caller(self) -> None:
+        runner = self.runners.get(TASK_NAME)
+
+        async def fail(bulk_items: list) -> list:
+            raise ConnectionError("unavailable")
+
+        runner.trigger_bulk_items = fail
+        batcher = TriggerBatcher(self.runners, max_batch_size=3, max_wait_seconds=0.01)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(batcher.submit(TASK_NAME, {"user_id": i}) for i in range(3)),
+                return_exceptions=True,
+            ),
+            timeout=1.0,
+        )
+
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+
+    async def test_short_bulk_response_fails_callers_instead_of_hanging(self) -> None:
+        runner = self.runners.get(TASK_NAME)
+        trigger_bulk_items = runner.trigger_bulk_items
+
+        async def drop_last(bulk_items: list) -> list:
+            return (await trigger_bulk_items(bulk_items))[:-1]
+
+        runner.trigger_bulk_items = drop_last
+        batcher = TriggerBatcher(self.runners, max_batch_size=3, max_wait_seconds=0.01)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(batcher.submit(TASK_NAME, {"user_id": i}) for i in range(3)),
+                return_exceptions=True,
+            ),
+            timeout=1.0,
+        )
+
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()